@@ -3,21 +3,26 @@
 """
 from operator import itemgetter
 
-import bitstruct
+import binascii
+import re
 import textwrap
 
 from .utils import ENCODER_AND_DECODER_STRUCTS
 from .utils import ENCODER_ABORT
 from .utils import DECODER_ABORT
 from .utils import Generator
+from .utils import LinesWriter
 from .utils import camel_to_snake_case
 from .utils import is_user_type
-from .utils import indent_lines
 from .utils import dedent_lines
 from .utils import canonical
 from .utils import format_default
 from ...codecs import oer
 
+# Fixed size OCTET STRINGs up to this size are copied with
+# encoder_append_fixed() and decoder_read_fixed(), which the C compiler
+# lowers to a few loads and stores.
+FIXED_SIZE_MAXIMUM = 32
 
 LENGTH_DETERMINANT_LENGTH = '''
 static uint32_t length_determinant_length(uint32_t value)
@@ -26,14 +31,8 @@ static uint32_t length_determinant_length(uint32_t value)
 
     if (value < 128u) {
         length = 1;
-    } else if (value < 256u) {
-        length = 2;
-    } else if (value < 65536u) {
-        length = 3;
-    } else if (value < 16777216u) {
-        length = 4;
     } else {
-        length = 5;
+        length = (minimum_uint_length(value) + 1u);
     }
 
     return (length);
@@ -43,6 +42,9 @@ static uint32_t length_determinant_length(uint32_t value)
 MINIMUM_UINT_LENGTH = '''
 static uint8_t minimum_uint_length(uint32_t value)
 {
+#if defined(__GNUC__) || defined(__clang__)
+    return ((uint8_t)((39 - __builtin_clz(value | 1u)) / 8));
+#else
     uint8_t length;
 
     if (value < 256u) {
@@ -56,10 +58,28 @@ static uint8_t minimum_uint_length(uint32_t value)
     }
 
     return (length);
+#endif
 }\
 '''
 
-ENCODER_INIT = '''\
+BIG_ENDIAN_CONVERSION = '''
+#if defined(__BYTE_ORDER__) && (__BYTE_ORDER__ == __ORDER_BIG_ENDIAN__)
+#    define ASN1TOOLS_BIG_ENDIAN_16(value) (value)
+#    define ASN1TOOLS_BIG_ENDIAN_32(value) (value)
+#    define ASN1TOOLS_BIG_ENDIAN_64(value) (value)
+#elif defined(__GNUC__) || defined(__clang__)
+#    define ASN1TOOLS_BIG_ENDIAN_16(value) __builtin_bswap16(value)
+#    define ASN1TOOLS_BIG_ENDIAN_32(value) __builtin_bswap32(value)
+#    define ASN1TOOLS_BIG_ENDIAN_64(value) __builtin_bswap64(value)
+#elif defined(_MSC_VER)
+#    include <stdlib.h>
+#    define ASN1TOOLS_BIG_ENDIAN_16(value) _byteswap_ushort(value)
+#    define ASN1TOOLS_BIG_ENDIAN_32(value) _byteswap_ulong(value)
+#    define ASN1TOOLS_BIG_ENDIAN_64(value) _byteswap_uint64(value)
+#endif\
+'''
+
+ENCODER_INIT = '''
 static void encoder_init(struct encoder_t *self_p,
                          uint8_t *buf_p,
                          size_t size)
@@ -97,7 +117,7 @@ static ssize_t encoder_alloc(struct encoder_t *self_p,
 
 ENCODER_APPEND_BYTES = '''
 static void encoder_append_bytes(struct encoder_t *self_p,
-                                 const uint8_t *buf_p,
+                                 const uint8_t *ASN1TOOLS_RESTRICT buf_p,
                                  size_t size)
 {
     ssize_t pos;
@@ -112,11 +132,25 @@ static void encoder_append_bytes(struct encoder_t *self_p,
 }\
 '''
 
+ENCODER_APPEND_FIXED = '''
+static void encoder_append_fixed(struct encoder_t *self_p,
+                                 const uint8_t *ASN1TOOLS_RESTRICT buf_p,
+                                 size_t size)
+{
+    if ((self_p->pos + (ssize_t)size) <= self_p->size) {
+        (void)memcpy(&self_p->buf_p[self_p->pos], buf_p, size);
+        self_p->pos += (ssize_t)size;
+    } else {
+        encoder_abort(self_p, ENOMEM);
+    }
+}\
+'''
+
 ENCODER_APPEND_UINT8 = '''
 static void encoder_append_uint8(struct encoder_t *self_p,
                                  uint8_t value)
 {
-    encoder_append_bytes(self_p, &value, sizeof(value));
+    encoder_append_fixed(self_p, &value, sizeof(value));
 }\
 '''
 
@@ -124,12 +158,18 @@ ENCODER_APPEND_UINT16 = '''
 static void encoder_append_uint16(struct encoder_t *self_p,
                                   uint16_t value)
 {
+#if defined(ASN1TOOLS_BIG_ENDIAN_16)
+    value = ASN1TOOLS_BIG_ENDIAN_16(value);
+
+    encoder_append_fixed(self_p, (const uint8_t *)&value, sizeof(value));
+#else
     uint8_t buf[2];
 
     buf[0] = (uint8_t)(value >> 8);
     buf[1] = (uint8_t)value;
 
-    encoder_append_bytes(self_p, &buf[0], sizeof(buf));
+    encoder_append_fixed(self_p, &buf[0], sizeof(buf));
+#endif
 }\
 '''
 
@@ -137,6 +177,11 @@ ENCODER_APPEND_UINT32 = '''
 static void encoder_append_uint32(struct encoder_t *self_p,
                                   uint32_t value)
 {
+#if defined(ASN1TOOLS_BIG_ENDIAN_32)
+    value = ASN1TOOLS_BIG_ENDIAN_32(value);
+
+    encoder_append_fixed(self_p, (const uint8_t *)&value, sizeof(value));
+#else
     uint8_t buf[4];
 
     buf[0] = (uint8_t)(value >> 24);
@@ -144,7 +189,8 @@ static void encoder_append_uint32(struct encoder_t *self_p,
     buf[2] = (uint8_t)(value >> 8);
     buf[3] = (uint8_t)value;
 
-    encoder_append_bytes(self_p, &buf[0], sizeof(buf));
+    encoder_append_fixed(self_p, &buf[0], sizeof(buf));
+#endif
 }\
 '''
 
@@ -152,6 +198,11 @@ ENCODER_APPEND_UINT64 = '''
 static void encoder_append_uint64(struct encoder_t *self_p,
                                   uint64_t value)
 {
+#if defined(ASN1TOOLS_BIG_ENDIAN_64)
+    value = ASN1TOOLS_BIG_ENDIAN_64(value);
+
+    encoder_append_fixed(self_p, (const uint8_t *)&value, sizeof(value));
+#else
     uint8_t buf[8];
 
     buf[0] = (uint8_t)(value >> 56);
@@ -163,7 +214,8 @@ static void encoder_append_uint64(struct encoder_t *self_p,
     buf[6] = (uint8_t)(value >> 8);
     buf[7] = (uint8_t)value;
 
-    encoder_append_bytes(self_p, &buf[0], sizeof(buf));
+    encoder_append_fixed(self_p, &buf[0], sizeof(buf));
+#endif
 }\
 '''
 
@@ -215,8 +267,13 @@ static void encoder_append_uint(struct encoder_t *self_p,
         break;
 
     case 3:
+#if defined(ASN1TOOLS_BIG_ENDIAN_32)
+        value = ASN1TOOLS_BIG_ENDIAN_32(value << 8);
+        encoder_append_fixed(self_p, (const uint8_t *)&value, 3);
+#else
         encoder_append_uint8(self_p, (uint8_t)(value >> 16));
         encoder_append_uint16(self_p, (uint16_t)value);
+#endif
         break;
 
     default:
@@ -253,7 +310,12 @@ static void encoder_append_double(struct encoder_t *self_p,
 ENCODER_APPEND_BOOL = '''
 static void encoder_append_bool(struct encoder_t *self_p, bool value)
 {
-    encoder_append_uint8(self_p, value ? 255u : 0u);
+    if (self_p->pos < self_p->size) {
+        self_p->buf_p[self_p->pos] = (uint8_t)(0u - (uint8_t)value);
+        self_p->pos++;
+    } else {
+        encoder_abort(self_p, ENOMEM);
+    }
 }\
 '''
 
@@ -261,20 +323,24 @@ ENCODER_APPEND_LENGTH_DETERMINANT = '''
 static void encoder_append_length_determinant(struct encoder_t *self_p,
                                               uint32_t length)
 {
+    uint8_t buf[5];
+    uint8_t number_of_bytes;
+    uint8_t offset;
+
+    buf[1] = (uint8_t)(length >> 24);
+    buf[2] = (uint8_t)(length >> 16);
+    buf[3] = (uint8_t)(length >> 8);
+    buf[4] = (uint8_t)length;
+
     if (length < 128u) {
-        encoder_append_int8(self_p, (int8_t)length);
-    } else if (length < 256u) {
-        encoder_append_uint8(self_p, 0x81u);
-        encoder_append_uint8(self_p, (uint8_t)length);
-    } else if (length < 65536u) {
-        encoder_append_uint8(self_p, 0x82u);
-        encoder_append_uint16(self_p, (uint16_t)length);
-    } else if (length < 16777216u) {
-        encoder_append_uint32(self_p, length | (0x83u << 24u));
+        offset = 4;
     } else {
-        encoder_append_uint8(self_p, 0x84u);
-        encoder_append_uint32(self_p, length);
+        number_of_bytes = minimum_uint_length(length);
+        offset = (uint8_t)(4u - number_of_bytes);
+        buf[offset] = (uint8_t)(0x80u | number_of_bytes);
     }
+
+    encoder_append_bytes(self_p, &buf[offset], 5u - offset);
 }\
 '''
 
@@ -316,7 +382,7 @@ static ssize_t decoder_free(struct decoder_t *self_p,
 
 DECODER_READ_BYTES = '''
 static void decoder_read_bytes(struct decoder_t *self_p,
-                               uint8_t *buf_p,
+                               uint8_t *ASN1TOOLS_RESTRICT buf_p,
                                size_t size)
 {
     ssize_t pos;
@@ -331,12 +397,27 @@ static void decoder_read_bytes(struct decoder_t *self_p,
 }\
 '''
 
+DECODER_READ_FIXED = '''
+static void decoder_read_fixed(struct decoder_t *self_p,
+                               uint8_t *ASN1TOOLS_RESTRICT buf_p,
+                               size_t size)
+{
+    if ((self_p->pos + (ssize_t)size) <= self_p->size) {
+        (void)memcpy(buf_p, &self_p->buf_p[self_p->pos], size);
+        self_p->pos += (ssize_t)size;
+    } else {
+        (void)memset(buf_p, 0, size);
+        decoder_abort(self_p, EOUTOFDATA);
+    }
+}\
+'''
+
 DECODER_READ_UINT8 = '''
 static uint8_t decoder_read_uint8(struct decoder_t *self_p)
 {
     uint8_t value;
 
-    decoder_read_bytes(self_p, &value, sizeof(value));
+    decoder_read_fixed(self_p, &value, sizeof(value));
 
     return (value);
 }\
@@ -345,34 +426,57 @@ static uint8_t decoder_read_uint8(struct decoder_t *self_p)
 DECODER_READ_UINT16 = '''
 static uint16_t decoder_read_uint16(struct decoder_t *self_p)
 {
+#if defined(ASN1TOOLS_BIG_ENDIAN_16)
+    uint16_t value;
+
+    decoder_read_fixed(self_p, (uint8_t *)&value, sizeof(value));
+
+    return (ASN1TOOLS_BIG_ENDIAN_16(value));
+#else
     uint8_t buf[2];
 
-    decoder_read_bytes(self_p, &buf[0], sizeof(buf));
+    decoder_read_fixed(self_p, &buf[0], sizeof(buf));
 
     return (uint16_t)(((uint16_t)buf[0] << 8) | (uint16_t)buf[1]);
+#endif
 }\
 '''
 
 DECODER_READ_UINT32 = '''
 static uint32_t decoder_read_uint32(struct decoder_t *self_p)
 {
+#if defined(ASN1TOOLS_BIG_ENDIAN_32)
+    uint32_t value;
+
+    decoder_read_fixed(self_p, (uint8_t *)&value, sizeof(value));
+
+    return (ASN1TOOLS_BIG_ENDIAN_32(value));
+#else
     uint8_t buf[4];
 
-    decoder_read_bytes(self_p, &buf[0], sizeof(buf));
+    decoder_read_fixed(self_p, &buf[0], sizeof(buf));
 
     return (((uint32_t)buf[0] << 24)
             | ((uint32_t)buf[1] << 16)
             | ((uint32_t)buf[2] << 8)
             | (uint32_t)buf[3]);
+#endif
 }\
 '''
 
 DECODER_READ_UINT64 = '''
 static uint64_t decoder_read_uint64(struct decoder_t *self_p)
 {
+#if defined(ASN1TOOLS_BIG_ENDIAN_64)
+    uint64_t value;
+
+    decoder_read_fixed(self_p, (uint8_t *)&value, sizeof(value));
+
+    return (ASN1TOOLS_BIG_ENDIAN_64(value));
+#else
     uint8_t buf[8];
 
-    decoder_read_bytes(self_p, &buf[0], sizeof(buf));
+    decoder_read_fixed(self_p, &buf[0], sizeof(buf));
 
     return (((uint64_t)buf[0] << 56)
             | ((uint64_t)buf[1] << 48)
@@ -382,6 +486,7 @@ static uint64_t decoder_read_uint64(struct decoder_t *self_p)
             | ((uint64_t)buf[5] << 16)
             | ((uint64_t)buf[6] << 8)
             | (uint64_t)buf[7]);
+#endif
 }\
 '''
 
@@ -430,8 +535,14 @@ static uint32_t decoder_read_uint(struct decoder_t *self_p,
         break;
 
     case 3:
+#if defined(ASN1TOOLS_BIG_ENDIAN_32)
+        value = 0;
+        decoder_read_fixed(self_p, (uint8_t *)&value, 3);
+        value = (ASN1TOOLS_BIG_ENDIAN_32(value) >> 8);
+#else
         value = (((uint32_t)decoder_read_uint8(self_p) << 16)
                  | decoder_read_uint16(self_p));
+#endif
         break;
 
     case 4:
@@ -478,7 +589,17 @@ static double decoder_read_double(struct decoder_t *self_p)
 DECODER_READ_BOOL = '''
 static bool decoder_read_bool(struct decoder_t *self_p)
 {
-    return (decoder_read_uint8(self_p) != 0u);
+    bool value;
+
+    if (self_p->pos < self_p->size) {
+        value = (self_p->buf_p[self_p->pos] != 0u);
+        self_p->pos++;
+    } else {
+        value = false;
+        decoder_abort(self_p, EOUTOFDATA);
+    }
+
+    return (value);
 }\
 '''
 
@@ -486,33 +607,39 @@ DECODER_READ_LENGTH_DETERMINANT = '''
 static uint32_t decoder_read_length_determinant(struct decoder_t *self_p)
 {
     uint32_t length;
+    uint8_t number_of_bytes;
+    ssize_t pos;
+#if !defined(ASN1TOOLS_BIG_ENDIAN_32)
+    uint8_t i;
+#endif
 
     length = decoder_read_uint8(self_p);
 
     if ((length & 0x80u) != 0u) {
-        switch (length & 0x7fu) {
-
-        case 1:
-            length = decoder_read_uint8(self_p);
-            break;
+        number_of_bytes = (uint8_t)(length & 0x7fu);
 
-        case 2:
-            length = decoder_read_uint16(self_p);
-            break;
+        if ((number_of_bytes == 0u) || (number_of_bytes > 4u)) {
+            return (0xffffffffu);
+        }
 
-        case 3:
-            length = (((uint32_t)decoder_read_uint8(self_p) << 16)
-                      | decoder_read_uint16(self_p));
-            break;
+        pos = decoder_free(self_p, number_of_bytes);
+        length = 0;
 
-        case 4:
-            length = decoder_read_uint32(self_p);
-            break;
+        if (pos < 0) {
+            return (length);
+        }
 
-        default:
-            length = 0xffffffffu;
-            break;
+#if defined(ASN1TOOLS_BIG_ENDIAN_32)
+        (void)memcpy(((uint8_t *)&length) + (4u - number_of_bytes),
+                     &self_p->buf_p[pos],
+                     number_of_bytes);
+        length = ASN1TOOLS_BIG_ENDIAN_32(length);
+#else
+        for (i = 0; i < number_of_bytes; i++) {
+            length <<= 8;
+            length |= self_p->buf_p[pos + i];
         }
+#endif
     }
 
     return (length);
@@ -538,6 +665,63 @@ static uint32_t decoder_read_tag(struct decoder_t *self_p)
 '''
 
 
+# Helper functions, each included if its pattern is found in the
+# generated definitions or in any helper already included. Helpers
+# must come after all helpers using them.
+HELPER_FUNCTIONS = [
+    ('decoder_read_tag(', DECODER_READ_TAG),
+    ('decoder_read_length_determinant(', DECODER_READ_LENGTH_DETERMINANT),
+    ('decoder_read_bool(', DECODER_READ_BOOL),
+    ('decoder_read_double(', DECODER_READ_DOUBLE),
+    ('decoder_read_float(', DECODER_READ_FLOAT),
+    ('decoder_read_uint(', DECODER_READ_UINT),
+    ('decoder_read_int64(', DECODER_READ_INT64),
+    ('decoder_read_int32(', DECODER_READ_INT32),
+    ('decoder_read_int16(', DECODER_READ_INT16),
+    ('decoder_read_int8(', DECODER_READ_INT8),
+    ('decoder_read_uint64(', DECODER_READ_UINT64),
+    ('decoder_read_uint32(', DECODER_READ_UINT32),
+    ('decoder_read_uint16(', DECODER_READ_UINT16),
+    ('decoder_read_uint8(', DECODER_READ_UINT8),
+    ('decoder_read_fixed(', DECODER_READ_FIXED),
+    ('decoder_read_bytes(', DECODER_READ_BYTES),
+    ('decoder_free(', DECODER_FREE),
+    ('decoder_abort(', DECODER_ABORT),
+    ('decoder_get_result(', DECODER_GET_RESULT),
+    ('decoder_init(', DECODER_INIT),
+    ('encoder_append_length_determinant(', ENCODER_APPEND_LENGTH_DETERMINANT),
+    ('encoder_append_bool(', ENCODER_APPEND_BOOL),
+    ('encoder_append_double(', ENCODER_APPEND_DOUBLE),
+    ('encoder_append_float(', ENCODER_APPEND_FLOAT),
+    ('encoder_append_uint(', ENCODER_APPEND_UINT),
+    ('encoder_append_int64(', ENCODER_APPEND_INT64),
+    ('encoder_append_int32(', ENCODER_APPEND_INT32),
+    ('encoder_append_int16(', ENCODER_APPEND_INT16),
+    ('encoder_append_int8(', ENCODER_APPEND_INT8),
+    ('encoder_append_uint64(', ENCODER_APPEND_UINT64),
+    ('encoder_append_uint32(', ENCODER_APPEND_UINT32),
+    ('encoder_append_uint16(', ENCODER_APPEND_UINT16),
+    ('encoder_append_uint8(', ENCODER_APPEND_UINT8),
+    ('encoder_append_fixed(', ENCODER_APPEND_FIXED),
+    ('encoder_append_bytes(', ENCODER_APPEND_BYTES),
+    ('encoder_alloc(', ENCODER_ALLOC),
+    ('encoder_abort(', ENCODER_ABORT),
+    ('encoder_get_result(', ENCODER_GET_RESULT),
+    ('encoder_init(', ENCODER_INIT),
+    ('ASN1TOOLS_BIG_ENDIAN_', BIG_ENDIAN_CONVERSION),
+    ('length_determinant_length(', LENGTH_DETERMINANT_LENGTH),
+    ('minimum_uint_length(', MINIMUM_UINT_LENGTH)
+]
+
+HELPER_PATTERN_RE = re.compile('|'.join([re.escape(pattern)
+                                         for pattern, _ in HELPER_FUNCTIONS]))
+
+HELPERS = [
+    (pattern, definition, set(HELPER_PATTERN_RE.findall(definition)))
+    for pattern, definition in HELPER_FUNCTIONS
+]
+
+
 def get_encoded_real_lengths(type_):
     return [4] if type_.fmt == '>f' else [8]
 
@@ -606,6 +790,41 @@ def get_sequence_additions_mask_length(additions):
     return (len(additions) + 7) // 8
 
 
+def format_present_mask_assignment(present_mask, present_bits):
+    """Assign all present bits of one present mask byte in a single
+    statement, one bit per line.
+
+    """
+
+    if not present_bits:
+        return ['{} = 0;'.format(present_mask)]
+
+    prefix = '{} = (uint8_t)('.format(present_mask)
+
+    if len(present_bits) == 1:
+        lines = [(prefix, present_bits[0])]
+    else:
+        lines = [(prefix + '(', present_bits[0] + ')')]
+        lines += [
+            (' ' * len(prefix) + '| (', present_bit + ')')
+            for present_bit in present_bits[1:]
+        ]
+
+    lines[-1] = (lines[-1][0], lines[-1][1] + ');')
+    wrapped_lines = []
+
+    for line_prefix, present_bit in lines:
+        wrapped_lines += textwrap.wrap(line_prefix + present_bit,
+                                       100,
+                                       subsequent_indent=' ' * (len(line_prefix) + 1))
+
+    return wrapped_lines
+
+
+def format_for_loop(i, end):
+    return 'for ({0} = 0; {0} < {1}; {0}++) {{'.format(i, end)
+
+
 def format_null_inner():
     return (
         [
@@ -624,6 +843,32 @@ class _Generator(Generator):
     def __init__(self, namespace):
         super(_Generator, self).__init__(namespace)
         self.additional_helpers = {}
+        self.integer_inner_formats = {}
+        self.user_type_inner_formats = {}
+
+        self.inline_type_formatters = {
+            oer.Integer: lambda type_, checker: self.format_integer_inner(checker),
+            oer.Real: lambda type_, checker: self.format_real_inner(type_),
+            oer.Null: lambda type_, checker: ([], []),
+            oer.Boolean: lambda type_, checker: self.format_boolean_inner()
+        }
+        self.type_formatters = {
+            oer.OctetString: (
+                lambda type_, checker: self.format_octet_string_inner(checker)),
+            oer.Sequence: self.format_sequence_inner,
+            oer.Choice: self.format_choice_inner,
+            oer.SequenceOf: self.format_sequence_of_inner,
+            oer.Enumerated: lambda type_, checker: self.format_enumerated_inner(type_)
+        }
+        self.definition_formatters = dict(self.inline_type_formatters)
+        self.definition_formatters.update(self.type_formatters)
+        self.definition_formatters[oer.Null] = (
+            lambda type_, checker: format_null_inner())
+        self.declaration_key_getters = {
+            oer.OctetString: self.get_octet_string_declaration_key,
+            oer.Sequence: self.get_sequence_declaration_key,
+            oer.SequenceOf: self.get_sequence_of_declaration_key
+        }
 
     def format_real(self, type_):
         if type_.fmt is None:
@@ -725,20 +970,21 @@ class _Generator(Generator):
         return lines
 
     def format_integer_inner(self, checker):
-        type_name = self.format_type_name(checker.minimum, checker.maximum)[:-2]
+        key = (checker.minimum, checker.maximum)
 
-        return (
-            [
-                'encoder_append_{}(encoder_p, src_p->{});'.format(
-                    type_name,
-                    self.location_inner())
-            ],
-            [
-                'dst_p->{} = decoder_read_{}(decoder_p);'.format(
-                    self.location_inner(),
-                    type_name)
-            ]
-        )
+        try:
+            encode_fmt, decode_fmt = self.integer_inner_formats[key]
+        except KeyError:
+            type_name = self.format_type_name(checker.minimum, checker.maximum)[:-2]
+            encode_fmt = 'encoder_append_{}(encoder_p, src_p->{{}});'.format(
+                type_name)
+            decode_fmt = 'dst_p->{{}} = decoder_read_{}(decoder_p);'.format(
+                type_name)
+            self.integer_inner_formats[key] = (encode_fmt, decode_fmt)
+
+        location = self.location_inner()
+
+        return [encode_fmt.format(location)], [decode_fmt.format(location)]
 
     def get_encoded_integer_lengths(self, checker):
         return [self.type_length(checker.minimum, checker.maximum) // 8]
@@ -775,8 +1021,8 @@ class _Generator(Generator):
         )
 
     def format_sequence_inner(self, type_, checker):
-        encode_lines = []
-        decode_lines = []
+        encode = LinesWriter()
+        decode = LinesWriter()
 
         optionals = get_sequence_optionals(type_)
         extension_bit = get_sequence_extension_bit(type_)
@@ -784,34 +1030,27 @@ class _Generator(Generator):
         present_mask_length = get_sequence_present_mask_length(optionals,
                                                                extension_bit)
         default_condition_by_member_name = {}
+        location = self.location_inner('', '.')
 
         if present_mask_length > 0:
             fmt = 'uint8_t {{}}[{}];'.format(present_mask_length)
             unique_present_mask = self.add_unique_variable(fmt, 'present_mask')
 
-            start_set_byte = 0
+            present_bits_by_byte = [[] for _ in range(present_mask_length)]
+            present_bit_fmt = 'src_p->{}is_{{}}_present'.format(location)
+            default_bit_fmt = '(src_p->{}{{}} != {{}})'.format(location)
+            decode_fmt = 'dst_p->{}is_{{}}_present = ({{}} & 1u);'.format(location)
+
             if extension_bit == 1 and len(type_.additions) > 0:
-                if_line = 'if({}) {{'.format(self.get_addition_present_condition(type_))
-                encode_lines.extend(textwrap.wrap(if_line, 100,
-                                                  subsequent_indent=' ' * len('if(')))
-                encode_lines.append('    {}[0] = 0x80;'.format(unique_present_mask))
-                encode_lines.append('}')
-                encode_lines.append('else {')
-                encode_lines.append('    {}[0] = 0x0;'.format(unique_present_mask))
-                encode_lines.append('}')
-                start_set_byte = 1
-
-            for i in range(start_set_byte, present_mask_length):
-                encode_lines.append('{}[{}] = 0;'.format(unique_present_mask, i))
-
-            encode_lines.append('')
-
-            decode_lines += [
+                present_bits_by_byte[0].append(
+                    '({}) << 7'.format(self.get_addition_present_condition(type_)))
+
+            decode.extend([
                 'decoder_read_bytes(decoder_p,',
                 '                   &{}[0],'.format(unique_present_mask),
                 '                   sizeof({}));'.format(unique_present_mask),
                 ''
-            ]
+            ])
 
             for i, member in enumerate(optionals, start=extension_bit):
                 byte, bit = divmod(i, 8)
@@ -822,38 +1061,34 @@ class _Generator(Generator):
                 default_condition_by_member_name[member.name] = default_condition
 
                 if member.optional:
-                    encode_lines += [
-                        'if (src_p->{}is_{}_present) {{'.format(
-                            self.location_inner('', '.'),
-                            member.name),
-                        '    {} |= {}u;'.format(present_mask, mask),
-                        '}',
-                        ''
-                    ]
-                    decode_lines.append(
-                        'dst_p->{0}is_{1}_present = (({2} & {3}u) == {3}u);'.format(
-                            self.location_inner('', '.'),
-                            member.name,
-                            present_mask,
-                            mask))
+                    present_bit = present_bit_fmt.format(member.name)
+
+                    if bit < 7:
+                        present_mask = '({} >> {})'.format(present_mask, 7 - bit)
+
+                    decode.append(decode_fmt.format(member.name, present_mask))
                 else:
-                    encode_lines += [
-                        'if (src_p->{}{} != {}) {{'.format(self.location_inner('', '.'),
-                                                           member.name,
-                                                           format_default(
-                                                               member.default)),
-                        '    {} |= {}u;'.format(present_mask, mask),
-                        '}',
-                        ''
-                    ]
+                    present_bit = default_bit_fmt.format(member.name,
+                                                         format_default(member.default))
 
-            encode_lines += [
+                if bit < 7:
+                    present_bit += ' << {}'.format(7 - bit)
+
+                present_bits_by_byte[byte].append(present_bit)
+
+            for byte, present_bits in enumerate(present_bits_by_byte):
+                encode.extend(format_present_mask_assignment(
+                    '{}[{}]'.format(unique_present_mask, byte),
+                    present_bits))
+
+            encode.extend([
+                '',
                 'encoder_append_bytes(encoder_p,',
                 '                     &{}[0],'.format(unique_present_mask),
                 '                     sizeof({}));'.format(unique_present_mask),
                 ''
-            ]
-            decode_lines.append('')
+            ])
+            decode.append('')
 
         for member in type_.root_members:
             (member_encode_lines,
@@ -862,8 +1097,8 @@ class _Generator(Generator):
                  checker,
                  default_condition_by_member_name)
 
-            encode_lines += member_encode_lines
-            decode_lines += member_decode_lines
+            encode.extend(member_encode_lines)
+            decode.extend(member_decode_lines)
 
         if type_.additions is not None and len(type_.additions) > 0:
             additions_encode_lines, additions_decode_lines = (
@@ -871,40 +1106,48 @@ class _Generator(Generator):
 
             addition_condition = 'if(({}[0] & 0x80u) == 0x80u) {{'.format(
                 unique_present_mask)
-            encode_lines += [
-                '',
-                addition_condition
-            ] + indent_lines(additions_encode_lines) + [
-                '}'
-            ]
+            encode.append('')
+            encode.append(addition_condition)
 
-            decode_lines += [
-                '',
-                addition_condition
-            ] + indent_lines(additions_decode_lines) + [
-                '}',
-                'else {'
-            ] + [
-                '    dst_p->{}is_{}_addition_present = false;'.format(
-                    self.location_inner('', '.'), addition.name)
-                for addition in type_.additions] + [
-                '}'
-            ]
+            with encode.block():
+                encode.extend(additions_encode_lines)
 
-        return encode_lines, decode_lines
+            encode.append('}')
+
+            decode.append('')
+            decode.append(addition_condition)
+
+            with decode.block():
+                decode.extend(additions_decode_lines)
+
+            decode.append('}')
+            decode.append('else {')
+
+            with decode.block():
+                for addition in type_.additions:
+                    decode.append('dst_p->{}is_{}_addition_present = false;'.format(
+                        location,
+                        addition.name))
+
+            decode.append('}')
+
+        return encode.lines, decode.lines
 
     def format_sequence_additions(self, type_, checker):
-        encode_lines = ['']
-        decode_lines = ['']
+        encode = LinesWriter()
+        decode = LinesWriter()
+        encode.append('')
+        decode.append('')
+        location = self.location_inner('', '.')
 
         addition_mask_length = get_sequence_additions_mask_length(type_.additions)
         addition_mask_unused_bits = (addition_mask_length * 8) - len(type_.additions)
 
-        encode_lines.append('encoder_append_length_determinant(encoder_p, {});'.format(
+        encode.append('encoder_append_length_determinant(encoder_p, {});'.format(
             addition_mask_length + 1))
         unique_addition_length = self.add_unique_decode_variable(
             'uint32_t {};', 'addition_length')
-        decode_lines += [
+        decode.extend([
             '{} = decoder_read_length_determinant(decoder_p);'.format(
                 unique_addition_length),
             '',
@@ -913,15 +1156,16 @@ class _Generator(Generator):
             '',
             '    return;',
             '}',
-            '{} -= 1u;'.format(unique_addition_length)]
+            '{} -= 1u;'.format(unique_addition_length)
+        ])
 
-        encode_lines.append('encoder_append_uint8(encoder_p, {});'.format(
+        encode.append('encoder_append_uint8(encoder_p, {});'.format(
             addition_mask_unused_bits))
         unique_addition_unused_bits = self.add_unique_decode_variable(
             'uint8_t {};', 'addition_unused_bits')
         unique_addition_bits = self.add_unique_decode_variable(
             'uint32_t {};', 'addition_bits')
-        decode_lines += [
+        decode.extend([
             '{} = decoder_read_uint8(decoder_p);'.format(unique_addition_unused_bits),
             '',
             'if ({} > 7u) {{'.format(unique_addition_unused_bits),
@@ -930,31 +1174,36 @@ class _Generator(Generator):
             '    return;',
             '}',
             '{} = (({} * 8u) - {});'.format(unique_addition_bits, unique_addition_length,
-                                            unique_addition_unused_bits)]
+                                            unique_addition_unused_bits)
+        ])
 
         fmt = 'uint8_t {{}}[{}];'.format(addition_mask_length)
         unique_addition_mask = self.add_unique_variable(
             fmt, 'addition_mask')
 
-        for i in range(addition_mask_length):
-            encode_lines.append('{}[{}] = 0;'.format(unique_addition_mask, i))
+        present_bits_by_byte = [[] for _ in range(addition_mask_length)]
+        present_bit_fmt = 'src_p->{}is_{{}}_addition_present'.format(location)
 
         for i, addition in enumerate(type_.additions):
             byte, bit = divmod(i, 8)
-            mask = '0x{:02x}'.format(1 << (7 - bit))
-            addition_mask = '{}[{}]'.format(unique_addition_mask,
-                                            byte)
-            encode_lines += [
-                '',
-                'if (src_p->{}is_{}_addition_present) {{'.format(
-                    self.location_inner('', '.'), addition.name),
-                '    {} |= {}u;'.format(addition_mask, mask),
-                '}'
-            ]
-        encode_lines += [
+            present_bit = present_bit_fmt.format(addition.name)
+
+            if bit < 7:
+                present_bit += ' << {}'.format(7 - bit)
+
+            present_bits_by_byte[byte].append(present_bit)
+
+        for byte, present_bits in enumerate(present_bits_by_byte):
+            encode.extend(format_present_mask_assignment(
+                '{}[{}]'.format(unique_addition_mask, byte),
+                present_bits))
+
+        encode.extend([
+            '',
             'encoder_append_bytes(encoder_p,',
             '                     &{}[0],'.format(unique_addition_mask),
-            '                     sizeof({}));'.format(unique_addition_mask)]
+            '                     sizeof({}));'.format(unique_addition_mask)
+        ])
 
         unique_i = self.add_unique_decode_variable('uint32_t {};', 'i')
         unique_tmp_addition_mask = self.add_unique_decode_variable('uint8_t {};',
@@ -963,7 +1212,7 @@ class _Generator(Generator):
             'uint32_t {};', 'unknown_addition_bits')
         unique_mask = self.add_unique_decode_variable('uint8_t {};', 'mask')
 
-        decode_lines += [
+        decode.extend([
             'decoder_read_bytes(decoder_p,',
             '                   {mask},'.format(mask=unique_addition_mask),
             '                   ({read} < {defined}u) ? {read} : {defined}u);'.format(
@@ -994,7 +1243,16 @@ class _Generator(Generator):
             '    };',
             '    {} >>= 1;'.format(unique_mask),
             '}'
-        ]
+        ])
+
+        decode_present_fmt = (
+            'dst_p->{location}is_{{name}}_addition_present = '
+            '(({addition_bits} > {{current_bit}}u) && '
+            '(({addition_mask}[{{index}}] & {{mask}}u) == {{mask}}u));'.format(
+                location=location,
+                addition_bits=unique_addition_bits,
+                addition_mask=unique_addition_mask))
+        decode_if_fmt = 'if (dst_p->{}is_{{}}_addition_present) {{{{'.format(location)
 
         for i, addition in enumerate(type_.additions):
             byte, bit = divmod(i, 8)
@@ -1013,40 +1271,32 @@ class _Generator(Generator):
                 encoded_lengths_as_string(encoded_lengths))
             wrapped_encoder_lines = textwrap.wrap(encoder_line, 100,
                                                   subsequent_indent=' ' * 4)
-            encode_lines += [
-                '',
-                'if (src_p->{}is_{}_addition_present) {{'
-                .format(self.location_inner('', '.'), addition.name)
-            ] + indent_lines(wrapped_encoder_lines + addition_encode_lines) + [
-                '}'
-            ]
-
-            decode_lines += [
-                'dst_p->{location}is_{name}_addition_present = '
-                '(({addition_bits} > {current_bit}u) && '
-                '(({addition_mask}[{index}] & {mask}u) == {mask}u));'.format(
-                    location=self.location_inner('', '.'),
-                    name=addition.name,
-                    addition_bits=unique_addition_bits,
-                    current_bit=i,
-                    addition_mask=unique_addition_mask,
-                    index=byte,
-                    mask=mask),
+            encode.append('')
+            encode.append('if ({}) {{'.format(present_bit_fmt.format(addition.name)))
+
+            with encode.block():
+                encode.extend(wrapped_encoder_lines)
+                encode.extend(addition_encode_lines)
+
+            encode.append('}')
+            decode.extend([
+                decode_present_fmt.format(name=addition.name,
+                                          current_bit=i,
+                                          index=byte,
+                                          mask=mask),
                 '',
-                'if (dst_p->{location}is_{name}_addition_present) {{'.format(
-                    location=self.location_inner('', '.'),
-                    name=addition.name),
+                decode_if_fmt.format(addition.name),
                 '    (void)decoder_read_length_determinant(decoder_p);'
-            ] + indent_lines(addition_decode_lines) + [
-                '}',
-                '']
+            ])
+
+            with decode.block():
+                decode.extend(addition_decode_lines)
+
+            decode.extend(['}', ''])
 
         unique_tmp_length = self.add_unique_decode_variable('uint32_t {};', 'tmp_length')
-        decode_lines += [
-            'for ({i} = 0; {i} < {unique_unknown_addition_bits}; {i}++) {{'.format(
-                i=unique_i,
-                first_bit=len(type_.additions),
-                unique_unknown_addition_bits=unique_unknown_addition_bits),
+        decode.extend([
+            format_for_loop(unique_i, unique_unknown_addition_bits),
             '    {} = decoder_read_length_determinant(decoder_p);'.format(
                 unique_tmp_length),
             '',
@@ -1054,9 +1304,10 @@ class _Generator(Generator):
             '',
             '        return;',
             '    }',
-            '}']
+            '}'
+        ])
 
-        return encode_lines, decode_lines
+        return encode.lines, decode.lines
 
     def get_encoded_sequence_lengths(self, type_, checker):
         lengths = []
@@ -1094,13 +1345,18 @@ class _Generator(Generator):
         location = self.location_inner('', '.')
 
         if checker.minimum == checker.maximum:
+            if 0 < checker.maximum <= FIXED_SIZE_MAXIMUM:
+                size_kind = 'fixed'
+            else:
+                size_kind = 'bytes'
+
             encode_lines = [
-                'encoder_append_bytes(encoder_p,',
+                'encoder_append_{}(encoder_p,'.format(size_kind),
                 '                     &src_p->{}buf[0],'.format(location),
                 '                     {});'.format(checker.maximum)
             ]
             decode_lines = [
-                'decoder_read_bytes(decoder_p,',
+                'decoder_read_{}(decoder_p,'.format(size_kind),
                 '                   &dst_p->{}buf[0],'.format(location),
                 '                   {});'.format(checker.maximum)
             ]
@@ -1172,25 +1428,39 @@ class _Generator(Generator):
                                  type_name_snake)
 
     def format_user_type_inner(self, type_name, module_name):
-        prefix = self.get_user_type_prefix(type_name, module_name)
-        encode_lines = [
-            '{}_encode_inner(encoder_p, &src_p->{});'.format(
-                prefix,
-                self.location_inner())
-        ]
-        decode_lines = [
-            '{}_decode_inner(decoder_p, &dst_p->{});'.format(
-                prefix,
-                self.location_inner())
-        ]
+        key = (type_name, module_name)
 
-        return encode_lines, decode_lines
+        try:
+            encode_fmt, decode_fmt = self.user_type_inner_formats[key]
+        except KeyError:
+            prefix = self.get_user_type_prefix(type_name, module_name)
+            encode_fmt = '{}_encode_inner(encoder_p, &src_p->{{}});'.format(prefix)
+            decode_fmt = '{}_decode_inner(decoder_p, &dst_p->{{}});'.format(prefix)
+            self.user_type_inner_formats[key] = (encode_fmt, decode_fmt)
+
+        location = self.location_inner()
+
+        return [encode_fmt.format(location)], [decode_fmt.format(location)]
 
     def format_choice_inner(self, type_, checker):
-        encode_lines = []
-        decode_lines = []
+        encode = LinesWriter()
+        decode = LinesWriter()
         unique_tag = self.add_unique_decode_variable('uint32_t {};', 'tag')
         choice = '{}choice'.format(self.location_inner('', '.'))
+        case_fmt = 'case {}_choice_{{}}_e:'.format(self.location)
+        choice_fmt = 'dst_p->{} = {}_choice_{{}}_e;'.format(choice, self.location)
+
+        encode.extend([
+            '',
+            'switch (src_p->{}) {{'.format(choice),
+            ''
+        ])
+        decode.extend([
+            '{} = decoder_read_tag(decoder_p);'.format(unique_tag),
+            '',
+            'switch ({}) {{'.format(unique_tag),
+            ''
+        ])
 
         for member in type_.root_members:
             member_checker = self.get_member_checker(checker,
@@ -1209,112 +1479,103 @@ class _Generator(Generator):
                 raise self.error(
                     'CHOICE tags of more than four bytes are not yet supported.')
 
-            tag = bitstruct.unpack('u{}'.format(8 * tag_length),
-                                   member.tag)[0]
-            tag = '0x{{:0{}x}}'.format(2 * tag_length).format(tag)
+            tag = '0x{}'.format(binascii.hexlify(member.tag).decode('ascii'))
+
+            encode.append(case_fmt.format(member.name))
 
-            choice_encode_lines = [
-                'encoder_append_uint(encoder_p, {}, {});'.format(
+            with encode.block():
+                encode.append('encoder_append_uint(encoder_p, {}, {});'.format(
                     tag,
-                    tag_length)
-            ] + choice_encode_lines + [
-                'break;'
-            ]
-            encode_lines += [
-                'case {}_choice_{}_e:'.format(self.location, member.name)
-            ] + indent_lines(choice_encode_lines) + [
-                ''
-            ]
+                    tag_length))
+                encode.extend(choice_encode_lines)
+                encode.append('break;')
 
-            choice_decode_lines = [
-                'dst_p->{} = {}_choice_{}_e;'.format(choice,
-                                                     self.location,
-                                                     member.name)
-            ] + choice_decode_lines + [
-                'break;'
-            ]
-            decode_lines += [
-                'case {}:'.format(tag)
-            ] + indent_lines(choice_decode_lines) + [
-                ''
-            ]
+            encode.append('')
 
-        encode_lines = [
-            '',
-            'switch (src_p->{}) {{'.format(choice),
-            ''
-        ] + encode_lines + [
+            decode.append('case {}:'.format(tag))
+
+            with decode.block():
+                decode.append(choice_fmt.format(member.name))
+                decode.extend(choice_decode_lines)
+                decode.append('break;')
+
+            decode.append('')
+
+        encode.extend([
             'default:',
             '    encoder_abort(encoder_p, EBADCHOICE);',
             '    break;',
             '}',
             ''
-        ]
-
-        decode_lines = [
-            '{} = decoder_read_tag(decoder_p);'.format(unique_tag),
-            '',
-            'switch ({}) {{'.format(unique_tag),
-            ''
-        ] + decode_lines + [
+        ])
+        decode.extend([
             'default:',
             '    decoder_abort(decoder_p, EBADCHOICE);',
             '    break;',
             '}',
             ''
-        ]
+        ])
 
-        return encode_lines, decode_lines
+        return encode.lines, decode.lines
 
     def get_encoded_choice_lengths(self, type_, checker):
-        function_name = 'get_choice_{}_length'.format(camel_to_snake_case(type_.name))
+        # Named after the choice location, as choices of different types
+        # or members may share a name, but not their length helper.
+        with self.asn1_members_backtrace_push(type_.name):
+            function_name = 'get_choice_{}_length'.format(self.location)
 
         if function_name not in self.additional_helpers:
-            with self.members_backtrace_push(type_.name):
-                choice = '{}choice'.format(self.location_inner('', '.'))
-                choice_length_lines = []
-
-                for member in type_.root_members:
-                    member_checker = self.get_member_checker(checker,
-                                                             member.name)
-
-                    with self.asn1_members_backtrace_push(member.name):
-                        with self.c_members_backtrace_push('value'):
-                            with self.c_members_backtrace_push(member.name):
-                                choice_type_lengths = self.get_encoded_type_lengths(
-                                    member,
-                                    member_checker)
-
-                    choice_type_lengths.append(len(member.tag))
-                    length_line = 'length = {};'.format(
-                        encoded_lengths_as_string(choice_type_lengths))
-                    wrapped_length_lines = textwrap.wrap(length_line, 100,
-                                                         subsequent_indent=' ' * 4)
-
-                    choice_length_lines += [
-                        'case {}_choice_{}_e:'.format(self.location, member.name)
-                    ] + indent_lines(wrapped_length_lines) + [
-                        '    break;',
-                        '']
-
-            length_lines = [
-                'uint32_t length;',
-                '',
-                'switch (src_p->{}) {{'.format(choice),
-                ''
-            ] + choice_length_lines + [
-                'default:',
-                '    length = 0;'
-                '    break;',
-                '}',
-                'return length;']
-
-            length_lines = [
-                'static uint32_t {}(const struct {}_t *src_p) {{'.format(
-                    function_name, self.location)
-            ] + indent_lines(length_lines) + [
-                '}']
-            self.additional_helpers[function_name] = length_lines
+            helper = LinesWriter()
+            helper.append('static uint32_t {}(const struct {}_t *src_p) {{'.format(
+                function_name,
+                self.location))
+
+            with helper.block():
+                with self.members_backtrace_push(type_.name):
+                    choice = '{}choice'.format(self.location_inner('', '.'))
+                    location = self.location
+                    helper.extend([
+                        'uint32_t length;',
+                        '',
+                        'switch (src_p->{}) {{'.format(choice),
+                        ''
+                    ])
+
+                    for member in type_.root_members:
+                        member_checker = self.get_member_checker(checker,
+                                                                 member.name)
+
+                        with self.asn1_members_backtrace_push(member.name):
+                            with self.c_members_backtrace_push('value'):
+                                with self.c_members_backtrace_push(member.name):
+                                    choice_type_lengths = self.get_encoded_type_lengths(
+                                        member,
+                                        member_checker)
+
+                        choice_type_lengths.append(len(member.tag))
+                        length_line = 'length = {};'.format(
+                            encoded_lengths_as_string(choice_type_lengths))
+                        helper.append('case {}_choice_{}_e:'.format(location,
+                                                                    member.name))
+
+                        with helper.block():
+                            helper.extend(textwrap.wrap(length_line,
+                                                        100,
+                                                        subsequent_indent=' ' * 4))
+                            helper.append('break;')
+
+                        helper.append('')
+
+                helper.extend([
+                    'default:',
+                    '    length = 0;'
+                    '    break;',
+                    '}',
+                    'return length;'
+                ])
+
+            helper.append('}')
+            self.additional_helpers[function_name] = helper.lines
 
         return ['{}(src_p)'.format(function_name)]
 
@@ -1333,17 +1594,18 @@ class _Generator(Generator):
 
         unique_enum_length = self.add_unique_variable('uint8_t {};',
                                                       'enum_length')
+        location = self.location_inner()
         encode_lines += [
             '{} = minimum_uint_length(src_p->{});'.format(
-                unique_enum_length, self.location_inner()),
+                unique_enum_length, location),
             '',
             'if ((uint32_t)src_p->{0} > 127u) {{'.format(
-                self.location_inner()),
+                location),
             '    encoder_append_uint8(encoder_p, 0x80u | {});'.format(
                 unique_enum_length),
             '}',
             'encoder_append_uint(encoder_p, (uint32_t)src_p->{}, {});'.format(
-                self.location_inner(), unique_enum_length)]
+                location, unique_enum_length)]
         decode_lines += [
             '{} = decoder_read_uint8(decoder_p);'.format(unique_enum_length),
             '',
@@ -1357,10 +1619,11 @@ class _Generator(Generator):
             '        return;',
             '    }',
             '    dst_p->{} = (enum {})decoder_read_uint(decoder_p, {});'.format(
-                self.location_inner(), type_name, unique_enum_length),
+                location, type_name, unique_enum_length),
             '}',
             'else {',
-            '    dst_p->{} = (enum {}){};'.format(self.location_inner(), type_name,
+            '    dst_p->{} = (enum {}){};'.format(location,
+                                                  type_name,
                                                   unique_enum_length),
             '}']
 
@@ -1375,6 +1638,18 @@ class _Generator(Generator):
         unique_number_of_length_bytes = self.add_unique_variable(
             'uint8_t {};',
             'number_of_length_bytes')
+        location = self.location_inner('', '.')
+
+        if checker.minimum == checker.maximum:
+            element_type_name = self.get_byte_element_type_name(type_, checker)
+
+            if element_type_name is not None:
+                return self.format_sequence_of_bytes_inner(
+                    checker,
+                    element_type_name,
+                    unique_number_of_length_bytes,
+                    location)
+
         unique_i = self.add_unique_variable(
             '{} {{}};'.format(self.format_type_name(0, checker.maximum)),
             'i')
@@ -1384,14 +1659,16 @@ class _Generator(Generator):
                                                             'length')
 
         with self.c_members_backtrace_push('elements[{}]'.format(unique_i)):
-            encode_lines, decode_lines = self.format_type_inner(
+            element_encode_lines, element_decode_lines = self.format_type_inner(
                 type_.element_type,
                 checker.element_type)
 
-        location = self.location_inner('', '.')
+        encode = LinesWriter()
+        decode = LinesWriter()
 
         if checker.minimum == checker.maximum:
-            encode_lines = [
+            for_loop = format_for_loop(unique_i, '{}u'.format(checker.maximum))
+            encode.extend([
                 '{} = minimum_uint_length({});'.format(
                     unique_number_of_length_bytes,
                     checker.maximum),
@@ -1401,11 +1678,9 @@ class _Generator(Generator):
                 '                    {},'.format(checker.maximum),
                 '                    {});'.format(unique_number_of_length_bytes),
                 '',
-                'for ({ui} = 0; {ui} < {maximum}u; {ui}++) {{'.format(
-                    ui=unique_i,
-                    maximum=checker.maximum),
-            ] + indent_lines(encode_lines)
-            decode_lines = [
+                for_loop
+            ])
+            decode.extend([
                 '{} = decoder_read_uint8(decoder_p);'.format(
                     unique_number_of_length_bytes),
                 '{} = decoder_read_uint8(decoder_p);'.format(unique_length),
@@ -1418,16 +1693,14 @@ class _Generator(Generator):
                 '    return;',
                 '}',
                 '',
-                'for ({ui} = 0; {ui} < {maximum}u; {ui}++) {{'.format(
-                    ui=unique_i,
-                    maximum=checker.maximum),
-            ] + indent_lines(decode_lines)
+                for_loop
+            ])
         else:
             if checker.maximum < 256:
                 cast = '(uint8_t)'
             else:
                 cast = ''
-            encode_lines = [
+            encode.extend([
                 '{} = minimum_uint_length(src_p->{}length);'.format(
                     unique_number_of_length_bytes,
                     location),
@@ -1437,11 +1710,9 @@ class _Generator(Generator):
                 '                    src_p->{}length,'.format(location),
                 '                    {});'.format(unique_number_of_length_bytes),
                 '',
-                'for ({ui} = 0; {ui} < src_p->{loc}length; {ui}++) {{'.format(
-                    ui=unique_i,
-                    loc=location),
-            ] + indent_lines(encode_lines)
-            decode_lines = [
+                format_for_loop(unique_i, 'src_p->{}length'.format(location))
+            ])
+            decode.extend([
                 '{} = decoder_read_uint8(decoder_p);'.format(
                     unique_number_of_length_bytes),
                 'dst_p->{}length = {}decoder_read_uint('.format(location, cast),
@@ -1454,13 +1725,95 @@ class _Generator(Generator):
                 '    return;',
                 '}',
                 '',
-                'for ({ui} = 0; {ui} < dst_p->{loc}length; {ui}++) {{'.format(
-                    loc=location,
-                    ui=unique_i),
-            ] + indent_lines(decode_lines)
+                format_for_loop(unique_i, 'dst_p->{}length'.format(location))
+            ])
+
+        with encode.block():
+            encode.extend(element_encode_lines)
+
+        with decode.block():
+            decode.extend(element_decode_lines)
+
+        encode.extend(['}', ''])
+        decode.extend(['}', ''])
+
+        return encode.lines, decode.lines
+
+    def get_byte_element_type_name(self, type_, checker):
+        """Returns the C type name of given SEQUENCE OF elements if they
+        are 8 bit integers, which are encoded exactly as they are stored
+        in memory, otherwise None.
+
+        """
 
-        encode_lines += ['}', '']
-        decode_lines += ['}', '']
+        if not isinstance(type_.element_type, oer.Integer):
+            return None
+
+        type_name = self.format_type_name(checker.element_type.minimum,
+                                          checker.element_type.maximum)
+
+        if type_name in ['uint8_t', 'int8_t']:
+            return type_name
+        else:
+            return None
+
+    def format_sequence_of_bytes_inner(self,
+                                       checker,
+                                       element_type_name,
+                                       unique_number_of_length_bytes,
+                                       location):
+        unique_length = self.add_unique_decode_variable('uint8_t {};',
+                                                        'length')
+
+        if 0 < checker.maximum <= FIXED_SIZE_MAXIMUM:
+            size_kind = 'fixed'
+        else:
+            size_kind = 'bytes'
+
+        if element_type_name == 'int8_t':
+            encode_cast = '(const uint8_t *)'
+            decode_cast = '(uint8_t *)'
+        else:
+            encode_cast = ''
+            decode_cast = ''
+
+        encode_lines = [
+            '{} = minimum_uint_length({});'.format(
+                unique_number_of_length_bytes,
+                checker.maximum),
+            'encoder_append_uint8(encoder_p, {});'.format(
+                unique_number_of_length_bytes),
+            'encoder_append_uint(encoder_p,',
+            '                    {},'.format(checker.maximum),
+            '                    {});'.format(unique_number_of_length_bytes),
+            '',
+            'encoder_append_{}(encoder_p,'.format(size_kind),
+            '                     {}&src_p->{}elements[0],'.format(
+                encode_cast,
+                location),
+            '                     {});'.format(checker.maximum),
+            ''
+        ]
+        decode_lines = [
+            '{} = decoder_read_uint8(decoder_p);'.format(
+                unique_number_of_length_bytes),
+            '{} = decoder_read_uint8(decoder_p);'.format(unique_length),
+            '',
+            'if (({} != 1u) || ({} > {}u)) {{'.format(unique_number_of_length_bytes,
+                                                      unique_length,
+                                                      checker.maximum),
+            '    decoder_abort(decoder_p, EBADLENGTH);',
+            '',
+            '    return;',
+            '}',
+            '',
+            'decoder_read_{}(decoder_p,'.format(size_kind),
+            '                   {}&dst_p->{}elements[0],'.format(
+                decode_cast,
+                location),
+            '                   {});'.format(checker.maximum),
+            ''
+        ]
 
         return encode_lines, decode_lines
 
@@ -1470,113 +1823,27 @@ class _Generator(Generator):
         inner_length = encoded_lengths_as_string(inner_lengths)
 
         with self.c_members_backtrace_push(type_.name):
+            location = self.location_inner('', '.')
 
             return [1,
-                    'minimum_uint_length(src_p->{loc}length)'.format(
-                        loc=self.location_inner('', '.')),
-                    '(uint32_t)(src_p->{loc}length * ({inner_length}))'.format(
-                        loc=self.location_inner('', '.'), inner_length=inner_length)]
-
-    def format_type_inner(self, type_, checker):
-        if isinstance(type_, oer.Integer):
-            return self.format_integer_inner(checker)
-        elif isinstance(type_, oer.Real):
-            return self.format_real_inner(type_)
-        elif isinstance(type_, oer.Null):
-            return [], []
-        elif isinstance(type_, oer.Boolean):
-            return self.format_boolean_inner()
-        elif is_user_type(type_):
-            return self.format_user_type_inner(type_.type_name,
-                                               type_.module_name)
-        elif isinstance(type_, oer.OctetString):
-            return self.format_octet_string_inner(checker)
-        elif isinstance(type_, oer.Sequence):
-            return self.format_sequence_inner(type_, checker)
-        elif isinstance(type_, oer.Choice):
-            return self.format_choice_inner(type_, checker)
-        elif isinstance(type_, oer.SequenceOf):
-            return self.format_sequence_of_inner(type_, checker)
-        elif isinstance(type_, oer.Enumerated):
-            return self.format_enumerated_inner(type_)
-        else:
-            raise self.error(str(type_))
-
-    def generate_definition_inner_process(self, type_, checker):
-        if isinstance(type_, oer.Integer):
-            return self.format_integer_inner(checker)
-        elif isinstance(type_, oer.Boolean):
-            return self.format_boolean_inner()
-        elif isinstance(type_, oer.Real):
-            return self.format_real_inner(type_)
-        elif isinstance(type_, oer.Sequence):
-            return self.format_sequence_inner(type_, checker)
-        elif isinstance(type_, oer.SequenceOf):
-            return self.format_sequence_of_inner(type_, checker)
-        elif isinstance(type_, oer.Choice):
-            return self.format_choice_inner(type_, checker)
-        elif isinstance(type_, oer.OctetString):
-            return self.format_octet_string_inner(checker)
-        elif isinstance(type_, oer.Enumerated):
-            return self.format_enumerated_inner(type_)
-        elif isinstance(type_, oer.Null):
-            return format_null_inner()
-        else:
-            return [], []
+                    'minimum_uint_length(src_p->{}length)'.format(location),
+                    '(uint32_t)(src_p->{}length * ({}))'.format(
+                        location,
+                        inner_length)]
 
     def generate_helpers(self, definitions):
         helpers = []
+        patterns = set(HELPER_PATTERN_RE.findall(definitions))
 
-        functions = [
-            ('decoder_read_tag(', DECODER_READ_TAG),
-            ('decoder_read_length_determinant(', DECODER_READ_LENGTH_DETERMINANT),
-            ('decoder_read_bool(', DECODER_READ_BOOL),
-            ('decoder_read_double(', DECODER_READ_DOUBLE),
-            ('decoder_read_float(', DECODER_READ_FLOAT),
-            ('decoder_read_uint(', DECODER_READ_UINT),
-            ('decoder_read_int64(', DECODER_READ_INT64),
-            ('decoder_read_int32(', DECODER_READ_INT32),
-            ('decoder_read_int16(', DECODER_READ_INT16),
-            ('decoder_read_int8(', DECODER_READ_INT8),
-            ('decoder_read_uint64(', DECODER_READ_UINT64),
-            ('decoder_read_uint32(', DECODER_READ_UINT32),
-            ('decoder_read_uint16(', DECODER_READ_UINT16),
-            ('decoder_read_uint8(', DECODER_READ_UINT8),
-            ('decoder_read_bytes(', DECODER_READ_BYTES),
-            ('decoder_free(', DECODER_FREE),
-            ('decoder_abort(', DECODER_ABORT),
-            ('decoder_get_result(', DECODER_GET_RESULT),
-            ('decoder_init(', DECODER_INIT),
-            ('encoder_append_length_determinant(', ENCODER_APPEND_LENGTH_DETERMINANT),
-            ('encoder_append_bool(', ENCODER_APPEND_BOOL),
-            ('encoder_append_double(', ENCODER_APPEND_DOUBLE),
-            ('encoder_append_float(', ENCODER_APPEND_FLOAT),
-            ('encoder_append_uint(', ENCODER_APPEND_UINT),
-            ('encoder_append_int64(', ENCODER_APPEND_INT64),
-            ('encoder_append_int32(', ENCODER_APPEND_INT32),
-            ('encoder_append_int16(', ENCODER_APPEND_INT16),
-            ('encoder_append_int8(', ENCODER_APPEND_INT8),
-            ('encoder_append_uint64(', ENCODER_APPEND_UINT64),
-            ('encoder_append_uint32(', ENCODER_APPEND_UINT32),
-            ('encoder_append_uint16(', ENCODER_APPEND_UINT16),
-            ('encoder_append_uint8(', ENCODER_APPEND_UINT8),
-            ('encoder_append_bytes(', ENCODER_APPEND_BYTES),
-            ('encoder_alloc(', ENCODER_ALLOC),
-            ('encoder_abort(', ENCODER_ABORT),
-            ('encoder_get_result(', ENCODER_GET_RESULT),
-            ('encoder_init(', ENCODER_INIT),
-            ('minimum_uint_length(', MINIMUM_UINT_LENGTH),
-            ('length_determinant_length(', LENGTH_DETERMINANT_LENGTH)
-        ]
-
-        for pattern, definition in functions:
-            is_in_helpers = any([pattern in helper for helper in helpers])
-
-            if pattern in definitions or is_in_helpers:
+        for pattern, definition, used_patterns in HELPERS:
+            if pattern in patterns:
                 helpers.insert(0, definition)
+                patterns.update(used_patterns)
 
-        for additional_helpers in self.additional_helpers.values():
-            helpers.extend(additional_helpers + [''])
+        # Sorted by name, as the types are not formatted in any specific
+        # order.
+        for function_name in sorted(self.additional_helpers):
+            helpers.extend(self.additional_helpers[function_name] + [''])
 
         return [ENCODER_AND_DECODER_STRUCTS] + helpers + ['']
 
@@ -444,6 +444,32 @@ def does_bits_match_range(number_of_bits, minimum, maximum):
 
 class _Generator(Generator):
 
+    def __init__(self, namespace):
+        super(_Generator, self).__init__(namespace)
+
+        self.inline_type_formatters = {
+            uper.Integer: self.format_integer_inner,
+            uper.Real: lambda type_, checker: self.format_real_inner(),
+            uper.Null: lambda type_, checker: ([], []),
+            uper.Boolean: lambda type_, checker: self.format_boolean_inner()
+        }
+        self.type_formatters = {
+            uper.OctetString: self.format_octet_string_inner,
+            uper.Sequence: self.format_sequence_inner,
+            uper.Choice: self.format_choice_inner,
+            uper.SequenceOf: self.format_sequence_of_inner,
+            uper.Enumerated: lambda type_, checker: self.format_enumerated_inner(type_)
+        }
+        self.definition_formatters = dict(self.inline_type_formatters)
+        self.definition_formatters.update(self.type_formatters)
+        self.definition_formatters[uper.Null] = (
+            lambda type_, checker: self.format_null_inner())
+        self.declaration_key_getters = {
+            uper.OctetString: self.get_octet_string_declaration_key,
+            uper.Sequence: self.get_sequence_declaration_key,
+            uper.SequenceOf: self.get_sequence_of_declaration_key
+        }
+
     def format_real(self):
         return []
 
@@ -512,28 +538,6 @@ class _Generator(Generator):
 
         return lines
 
-    def generate_definition_inner_process(self, type_, checker):
-        if isinstance(type_, uper.Integer):
-            return self.format_integer_inner(type_, checker)
-        elif isinstance(type_, uper.Boolean):
-            return self.format_boolean_inner()
-        elif isinstance(type_, uper.Real):
-            return self.format_real_inner()
-        elif isinstance(type_, uper.Sequence):
-            return self.format_sequence_inner(type_, checker)
-        elif isinstance(type_, uper.SequenceOf):
-            return self.format_sequence_of_inner(type_, checker)
-        elif isinstance(type_, uper.Choice):
-            return self.format_choice_inner(type_, checker)
-        elif isinstance(type_, uper.OctetString):
-            return self.format_octet_string_inner(type_, checker)
-        elif isinstance(type_, uper.Enumerated):
-            return self.format_enumerated_inner(type_)
-        elif isinstance(type_, uper.Null):
-            return self.format_null_inner()
-        else:
-            return [], []
-
     def format_integer_inner(self, type_, checker):
         type_name = self.format_type_name(checker.minimum, checker.maximum)
         suffix = type_name[:-2]
@@ -943,31 +947,6 @@ class _Generator(Generator):
 
         return encode_lines, decode_lines
 
-    def format_type_inner(self, type_, checker):
-        if isinstance(type_, uper.Integer):
-            return self.format_integer_inner(type_, checker)
-        elif isinstance(type_, uper.Real):
-            return self.format_real_inner()
-        elif isinstance(type_, uper.Null):
-            return [], []
-        elif isinstance(type_, uper.Boolean):
-            return self.format_boolean_inner()
-        elif is_user_type(type_):
-            return self.format_user_type_inner(type_.type_name,
-                                               type_.module_name)
-        elif isinstance(type_, uper.OctetString):
-            return self.format_octet_string_inner(type_, checker)
-        elif isinstance(type_, uper.Sequence):
-            return self.format_sequence_inner(type_, checker)
-        elif isinstance(type_, uper.Choice):
-            return self.format_choice_inner(type_, checker)
-        elif isinstance(type_, uper.SequenceOf):
-            return self.format_sequence_of_inner(type_, checker)
-        elif isinstance(type_, uper.Enumerated):
-            return self.format_enumerated_inner(type_)
-        else:
-            raise self.error(type_)
-
     def generate_helpers(self, definitions):
         helpers = []
 
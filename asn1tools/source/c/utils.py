@@ -8,7 +8,7 @@ TYPE_DECLARATION_FMT = '''\
  * Type {type_name} in module {module_name}.
  */
 {helper_types}\
-struct {namespace}_{module_name_snake}_{type_name_snake}_t {{
+struct {type_prefix}_t {{
 {members}
 }};
 '''
@@ -23,10 +23,10 @@ DECLARATION_FMT = '''\
  *
  * @return Encoded data length or negative error code.
  */
-ssize_t {namespace}_{module_name_snake}_{type_name_snake}_encode(
+ssize_t {type_prefix}_encode(
     uint8_t *dst_p,
     size_t size,
-    const struct {namespace}_{module_name_snake}_{type_name_snake}_t *src_p);
+    const struct {type_prefix}_t *src_p);
 
 /**
  * Decode type {type_name} defined in module {module_name}.
@@ -37,65 +37,75 @@ ssize_t {namespace}_{module_name_snake}_{type_name_snake}_encode(
  *
  * @return Number of bytes decoded or negative error code.
  */
-ssize_t {namespace}_{module_name_snake}_{type_name_snake}_decode(
-    struct {namespace}_{module_name_snake}_{type_name_snake}_t *dst_p,
+ssize_t {type_prefix}_decode(
+    struct {type_prefix}_t *dst_p,
     const uint8_t *src_p,
     size_t size);
 '''
 
 DEFINITION_INNER_FMT = '''\
-static void {namespace}_{module_name_snake}_{type_name_snake}_encode_inner(
+static void {type_prefix}_encode_inner(
     struct encoder_t *encoder_p,
-    const struct {namespace}_{module_name_snake}_{type_name_snake}_t *src_p)
+    const struct {type_prefix}_t *src_p)
 {{
 {encode_body}\
 }}
 
-static void {namespace}_{module_name_snake}_{type_name_snake}_decode_inner(
+static void {type_prefix}_decode_inner(
     struct decoder_t *decoder_p,
-    struct {namespace}_{module_name_snake}_{type_name_snake}_t *dst_p)
+    struct {type_prefix}_t *dst_p)
 {{
 {decode_body}\
 }}
 '''
 
 DEFINITION_FMT = '''\
-ssize_t {namespace}_{module_name_snake}_{type_name_snake}_encode(
+ssize_t {type_prefix}_encode(
     uint8_t *dst_p,
     size_t size,
-    const struct {namespace}_{module_name_snake}_{type_name_snake}_t *src_p)
+    const struct {type_prefix}_t *src_p)
 {{
     struct encoder_t encoder;
 
     encoder_init(&encoder, dst_p, size);
-    {namespace}_{module_name_snake}_{type_name_snake}_encode_inner(&encoder, src_p);
+    {type_prefix}_encode_inner(&encoder, src_p);
 
     return (encoder_get_result(&encoder));
 }}
 
-ssize_t {namespace}_{module_name_snake}_{type_name_snake}_decode(
-    struct {namespace}_{module_name_snake}_{type_name_snake}_t *dst_p,
+ssize_t {type_prefix}_decode(
+    struct {type_prefix}_t *dst_p,
     const uint8_t *src_p,
     size_t size)
 {{
     struct decoder_t decoder;
 
     decoder_init(&decoder, src_p, size);
-    {namespace}_{module_name_snake}_{type_name_snake}_decode_inner(&decoder, dst_p);
+    {type_prefix}_decode_inner(&decoder, dst_p);
 
     return (decoder_get_result(&decoder));
 }}
 '''
 
 ENCODER_AND_DECODER_STRUCTS = '''\
+#if !defined(ASN1TOOLS_RESTRICT)
+#    if defined(_MSC_VER)
+#        define ASN1TOOLS_RESTRICT __restrict
+#    elif defined(__STDC_VERSION__) && (__STDC_VERSION__ >= 199901L)
+#        define ASN1TOOLS_RESTRICT restrict
+#    else
+#        define ASN1TOOLS_RESTRICT
+#    endif
+#endif
+
 struct encoder_t {
-    uint8_t *buf_p;
+    uint8_t *ASN1TOOLS_RESTRICT buf_p;
     ssize_t size;
     ssize_t pos;
 };
 
 struct decoder_t {
-    const uint8_t *buf_p;
+    const uint8_t *ASN1TOOLS_RESTRICT buf_p;
     ssize_t size;
     ssize_t pos;
 };
@@ -139,21 +149,79 @@ class _MembersBacktracesContext(object):
             backtrace.pop()
 
 
+class _BlockContext(object):
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.start = None
+
+    def __enter__(self):
+        self.writer.indent += '    '
+        self.start = len(self.writer.lines)
+
+    def __exit__(self, *args):
+        lines = self.writer.lines
+        lines[self.start:] = strip_blank_lines(lines[self.start:])
+        self.writer.indent = self.writer.indent[:-4]
+
+
+class LinesWriter(object):
+    """Collects lines of C source code, indenting each line once when
+    added by the number of currently open blocks. Blank lines at the
+    start and end of a block are removed when it is closed, just as
+    indent_lines() does.
+
+    """
+
+    def __init__(self):
+        self.lines = []
+        self.indent = ''
+
+    def append(self, line):
+        if line:
+            line = self.indent + line
+
+        self.lines.append(line)
+
+    def extend(self, lines):
+        indent = self.indent
+
+        if indent:
+            self.lines.extend([indent + line if line else line for line in lines])
+        else:
+            self.lines.extend(lines)
+
+    def block(self):
+        return _BlockContext(self)
+
+
 class _UserType(object):
 
+    __slots__ = (
+        'type_name',
+        'module_name',
+        'type_declaration',
+        'declaration',
+        'definition_inner',
+        'definition',
+        'used_user_types'
+    )
+
     def __init__(self,
                  type_name,
                  module_name,
                  type_declaration,
                  declaration,
                  definition_inner,
-                 definition):
+                 definition,
+                 used_user_types):
         self.type_name = type_name
         self.module_name = module_name
         self.type_declaration = type_declaration
         self.declaration = declaration
         self.definition_inner = definition_inner
         self.definition = definition
+        self.used_user_types = used_user_types
 
 
 def format_default(default):
@@ -171,28 +239,54 @@ class Generator(object):
         self.c_members_backtrace = []
         self.module_name = None
         self.type_name = None
+        self.module_name_snake = None
+        self.type_name_snake = None
+        self.type_prefix = None
         self.helper_lines = []
         self.base_variables = set()
         self.used_suffixes_by_base_variables = {}
         self.encode_variable_lines = []
         self.decode_variable_lines = []
         self.used_user_types = []
+        self.used_user_types_set = set()
+        self.member_checkers_by_checker = {}
+        self.type_format_kwargs = {}
+        self.declaration_keys_by_type_id = {}
+        self.declaration_lines_by_key = {}
+        self.member_lines_by_key = {}
+
+        # Inner formatters by type class, supplied by the codecs. Types
+        # in the first table are always formatted inline, even if
+        # referenced as user types.
+        self.inline_type_formatters = {}
+        self.type_formatters = {}
+        self.definition_formatters = {}
+
+        # Declaration key getters of the types whose declaration only
+        # depends on their shape, supplied by the codecs.
+        self.declaration_key_getters = {}
 
     def reset_type(self):
+        # The snake case names and the prefix of all C identifiers of
+        # the current type are used over and over, so they are only
+        # created once per type.
+        self.module_name_snake = camel_to_snake_case(self.module_name)
+        self.type_name_snake = camel_to_snake_case(self.type_name)
+        self.type_prefix = '{}_{}_{}'.format(self.namespace,
+                                             self.module_name_snake,
+                                             self.type_name_snake)
         self.helper_lines = []
         self.base_variables = set()
         self.used_suffixes_by_base_variables = {}
         self.encode_variable_lines = []
         self.decode_variable_lines = []
         self.used_user_types = []
-
-    @property
-    def module_name_snake(self):
-        return camel_to_snake_case(self.module_name)
-
-    @property
-    def type_name_snake(self):
-        return camel_to_snake_case(self.type_name)
+        self.used_user_types_set = set()
+        self.type_format_kwargs = {
+            'type_prefix': self.type_prefix,
+            'module_name': self.module_name,
+            'type_name': self.type_name
+        }
 
     def type_length(self, minimum, maximum):
         # Make sure it fits in 64 bits.
@@ -246,15 +340,15 @@ class Generator(object):
         return type_name
 
     def get_addition_present_condition(self, type_):
-        return ' || '.join(['src_p->{}is_{}_addition_present'.
-                            format(self.location_inner('', '.'), addition.name)
+        location = self.location_inner('', '.')
+
+        return ' || '.join(['src_p->{}is_{}_addition_present'.format(location,
+                                                                     addition.name)
                             for addition in type_.additions])
 
     @property
     def location(self):
-        location = '{}_{}_{}'.format(self.namespace,
-                                     self.module_name_snake,
-                                     self.type_name_snake)
+        location = self.type_prefix
 
         if self.asn1_members_backtrace:
             location += '_{}'.format('_'.join(self.asn1_members_backtrace))
@@ -294,11 +388,20 @@ class Generator(object):
         return _MembersBacktracesContext(backtraces, member_name)
 
     def get_member_checker(self, checker, name):
-        for member in checker.members:
-            if member.name == name:
-                return member
+        try:
+            member_checkers = self.member_checkers_by_checker[checker]
+        except KeyError:
+            member_checkers = {}
+
+            for member in checker.members:
+                member_checkers.setdefault(member.name, member)
+
+            self.member_checkers_by_checker[checker] = member_checkers
 
-        raise Error('No member checker found for {}.'.format(name))
+        try:
+            return member_checkers[name]
+        except KeyError:
+            raise Error('No member checker found for {}.'.format(name))
 
     def add_unique_variable(self, fmt, name, variable_lines=None):
         if name in self.base_variables:
@@ -336,7 +439,7 @@ class Generator(object):
         member_checker = self.get_member_checker(checker, member.name)
 
         with self.members_backtrace_push(member.name):
-            member_lines = self.format_type(member, member_checker)
+            member_lines = self.format_member_type(member, member_checker)
 
         if member_lines:
             member_lines[-1] += ' {};'.format(member.name)
@@ -400,7 +503,7 @@ class Generator(object):
         if not checker.is_bound():
             raise self.error('SEQUENCE OF has no maximum length.')
 
-        lines = self.format_type(type_.element_type, checker.element_type)
+        lines = self.format_member_type(type_.element_type, checker.element_type)
 
         if lines:
             lines[-1] += ' elements[{}];'.format(checker.maximum)
@@ -439,7 +542,7 @@ class Generator(object):
                                                      member.name)
 
             with self.members_backtrace_push(member.name):
-                choice_lines = self.format_type(member, member_checker)
+                choice_lines = self.format_member_type(member, member_checker)
 
             if choice_lines:
                 choice_lines[-1] += ' {};'.format(member.name)
@@ -470,12 +573,131 @@ class Generator(object):
         module_name_snake = camel_to_snake_case(module_name)
         type_name_snake = camel_to_snake_case(type_name)
 
-        self.used_user_types.append((type_name, module_name))
+        self.add_used_user_type((type_name, module_name))
 
         return ['struct {}_{}_{}_t'.format(self.namespace,
                                            module_name_snake,
                                            type_name_snake)]
 
+    def add_used_user_type(self, user_type):
+        # Keep the first use order, as it defines the order of the
+        # generated types.
+        if user_type not in self.used_user_types_set:
+            self.used_user_types_set.add(user_type)
+            self.used_user_types.append(user_type)
+
+    def get_declaration_key(self, type_, checker, is_member=True):
+        """Returns a hashable key of everything the C declaration of given
+        type depends on, or None if it also depends on the location of
+        the type, as enumerations and choices do. Keys are remembered
+        per type object, so members are only walked once.
+
+        """
+
+        try:
+            return self.declaration_keys_by_type_id[id(type_)]
+        except KeyError:
+            pass
+
+        if self.get_type_formatter(self.inline_type_formatters, type_) is not None:
+            # The declaration of a REAL depends on its format.
+            key = (type(type_),
+                   checker.minimum,
+                   checker.maximum,
+                   getattr(type_, 'fmt', None))
+        elif is_member and is_user_type(type_):
+            key = (_UserType, type_.type_name, type_.module_name)
+        else:
+            get_key = self.get_type_formatter(self.declaration_key_getters, type_)
+
+            if get_key is None:
+                key = None
+            else:
+                key = get_key(type_, checker)
+
+        self.declaration_keys_by_type_id[id(type_)] = key
+
+        return key
+
+    def get_octet_string_declaration_key(self, type_, checker):
+        return (type(type_), checker.minimum, checker.maximum)
+
+    def get_sequence_declaration_key(self, type_, checker):
+        members = list(type_.root_members)
+
+        if type_.additions is not None:
+            members += type_.additions
+
+        key = [type(type_), len(type_.root_members)]
+
+        for member in members:
+            member_checker = self.get_member_checker(checker, member.name)
+            member_key = self.get_declaration_key(member, member_checker)
+
+            if member_key is None:
+                return None
+
+            key.append((member.name, member.optional, member_key))
+
+        return tuple(key)
+
+    def get_sequence_of_declaration_key(self, type_, checker):
+        element_key = self.get_declaration_key(type_.element_type,
+                                               checker.element_type)
+
+        if element_key is None:
+            return None
+
+        return (type(type_), checker.minimum, checker.maximum, element_key)
+
+    def format_cached_type(self,
+                           type_,
+                           checker,
+                           is_member,
+                           lines_by_key,
+                           format_type):
+        """Formats given type with given function, or reuses the lines of
+        an earlier type with the same declaration key. The user types
+        used by the lines are collected separately and replayed on reuse
+        to keep the dependencies.
+
+        """
+
+        key = self.get_declaration_key(type_, checker, is_member)
+
+        if key is None:
+            return format_type(type_, checker)
+
+        try:
+            lines, used_user_types = lines_by_key[key]
+        except KeyError:
+            saved_user_types = (self.used_user_types, self.used_user_types_set)
+            self.used_user_types = []
+            self.used_user_types_set = set()
+
+            try:
+                lines = format_type(type_, checker)
+                used_user_types = self.used_user_types
+            finally:
+                self.used_user_types, self.used_user_types_set = saved_user_types
+
+            lines_by_key[key] = (list(lines), used_user_types)
+        else:
+            # Callers append to the returned lines.
+            lines = list(lines)
+
+        for user_type in used_user_types:
+            self.add_used_user_type(user_type)
+
+        return lines
+
+    def format_member_type(self, type_, checker):
+        return self.format_cached_type(type_,
+                                       checker,
+                                       True,
+                                       self.member_lines_by_key,
+                                       self.format_type)
+
     def format_sequence_inner_member(self,
                                      member,
                                      checker,
@@ -531,8 +753,13 @@ class Generator(object):
     def generate_type_declaration(self, compiled_type):
         type_ = compiled_type.type
         checker = compiled_type.constraints_checker.type
-
-        lines = self.generate_type_declaration_process(type_, checker)
+        # Types with the same shape, for example aliases, share the
+        # declaration members.
+        lines = self.format_cached_type(type_,
+                                        checker,
+                                        False,
+                                        self.declaration_lines_by_key,
+                                        self.generate_type_declaration_process)
 
         if not lines:
             lines = ['uint8_t dummy;']
@@ -543,76 +770,75 @@ class Generator(object):
             self.helper_lines.append('')
 
         return [
-            TYPE_DECLARATION_FMT.format(namespace=self.namespace,
-                                        module_name=self.module_name,
-                                        type_name=self.type_name,
-                                        module_name_snake=self.module_name_snake,
-                                        type_name_snake=self.type_name_snake,
-                                        helper_types='\n'.join(self.helper_lines),
-                                        members='\n'.join(lines))
+            TYPE_DECLARATION_FMT.format(helper_types='\n'.join(self.helper_lines),
+                                        members='\n'.join(lines),
+                                        **self.type_format_kwargs)
         ]
 
     def generate_declaration(self):
-        return DECLARATION_FMT.format(namespace=self.namespace,
-                                      module_name=self.module_name,
-                                      type_name=self.type_name,
-                                      module_name_snake=self.module_name_snake,
-                                      type_name_snake=self.type_name_snake)
+        return DECLARATION_FMT.format(**self.type_format_kwargs)
 
     def generate_definition(self):
-        return DEFINITION_FMT.format(namespace=self.namespace,
-                                     module_name_snake=self.module_name_snake,
-                                     type_name_snake=self.type_name_snake)
+        return DEFINITION_FMT.format(**self.type_format_kwargs)
 
     def generate_definition_inner(self, compiled_type):
         encode_lines, decode_lines = self.generate_definition_inner_process(
             compiled_type.type,
             compiled_type.constraints_checker.type)
 
-        if self.encode_variable_lines:
-            encode_lines = self.encode_variable_lines + [''] + encode_lines
+        encode_body = format_function_body(self.encode_variable_lines, encode_lines)
+        decode_body = format_function_body(self.decode_variable_lines, decode_lines)
+
+        return DEFINITION_INNER_FMT.format(encode_body=encode_body,
+                                           decode_body=decode_body,
+                                           **self.type_format_kwargs)
+
+    def generate_user_type(self, type_name, module_name, compiled_type):
+        """Returns the generated code of given type and the user types it
+        depends on, or None if the type has no declaration.
+
+        """
+
+        self.module_name = module_name
+        self.type_name = type_name
+        self.reset_type()
+
+        type_declaration = self.generate_type_declaration(compiled_type)
 
-        if self.decode_variable_lines:
-            decode_lines = self.decode_variable_lines + [''] + decode_lines
+        if not type_declaration:
+            return None
 
-        encode_lines = indent_lines(encode_lines) + ['']
-        decode_lines = indent_lines(decode_lines) + ['']
+        declaration = self.generate_declaration()
+        definition_inner = self.generate_definition_inner(compiled_type)
+        definition = self.generate_definition()
 
-        return DEFINITION_INNER_FMT.format(namespace=self.namespace,
-                                           module_name_snake=self.module_name_snake,
-                                           type_name_snake=self.type_name_snake,
-                                           encode_body='\n'.join(encode_lines),
-                                           decode_body='\n'.join(decode_lines))
+        return _UserType(type_name,
+                         module_name,
+                         type_declaration,
+                         declaration,
+                         definition_inner,
+                         definition,
+                         self.used_user_types)
 
     def generate(self, compiled):
         user_types = {}
         user_type_dependencies = {}
 
-        for module_name, module in sorted(compiled.modules.items()):
-            self.module_name = module_name
-
-            for type_name, compiled_type in sorted(module.items()):
-                self.type_name = type_name
-                self.reset_type()
-
-                type_declaration = self.generate_type_declaration(compiled_type)
+        # The output order is defined by topological_sort(), which sorts
+        # the types itself, so no need to sort them here.
+        for module_name, module in compiled.modules.items():
+            for type_name, compiled_type in module.items():
+                user_type = self.generate_user_type(type_name,
+                                                    module_name,
+                                                    compiled_type)
 
-                if not type_declaration:
+                if user_type is None:
                     continue
 
-                declaration = self.generate_declaration()
-                definition_inner = self.generate_definition_inner(compiled_type)
-                definition = self.generate_definition()
-
-                user_type = _UserType(type_name,
-                                      module_name,
-                                      type_declaration,
-                                      declaration,
-                                      definition_inner,
-                                      definition)
                 user_type_name_tuple = (user_type.type_name, user_type.module_name)
                 user_types[user_type_name_tuple] = user_type
-                user_type_dependencies[user_type_name_tuple] = self.used_user_types
+                user_type_dependencies[user_type_name_tuple] = (
+                    user_type.used_user_types)
 
         user_type_sorted_names = topological_sort(user_type_dependencies)
 
@@ -628,9 +854,13 @@ class Generator(object):
             definitions_inner.append(user_type.definition_inner)
             definitions.append(user_type.definition)
 
+        # Join the inner definitions and the definitions in one pass,
+        # without first concatenating the two lists.
+        definitions_inner.extend(definitions)
+
         type_declarations = '\n'.join(type_declarations)
         declarations = '\n'.join(declarations)
-        definitions = '\n'.join(definitions_inner + definitions)
+        definitions = '\n'.join(definitions_inner)
         helpers = '\n'.join(self.generate_helpers(definitions))
 
         return type_declarations, declarations, helpers, definitions
@@ -638,8 +868,43 @@ class Generator(object):
     def format_type(self, type_, checker):
         raise NotImplementedError('To be implemented by subclasses.')
 
+    def get_type_formatter(self, formatters, type_):
+        """Returns the formatter of given type in given table, or None if
+        missing. Subclasses of the types in the table use the formatter
+        of their closest base class, which is then added to the table.
+
+        """
+
+        class_ = type(type_)
+
+        try:
+            return formatters[class_]
+        except KeyError:
+            pass
+
+        for base_class in class_.__mro__[1:]:
+            if base_class in formatters:
+                formatter = formatters[base_class]
+                formatters[class_] = formatter
+
+                return formatter
+
+        return None
+
     def format_type_inner(self, type_, checker):
-        raise NotImplementedError('To be implemented by subclasses.')
+        formatter = self.get_type_formatter(self.inline_type_formatters, type_)
+
+        if formatter is None:
+            if is_user_type(type_):
+                return self.format_user_type_inner(type_.type_name,
+                                                   type_.module_name)
+
+            formatter = self.get_type_formatter(self.type_formatters, type_)
+
+            if formatter is None:
+                raise self.error(str(type_))
+
+        return formatter(type_, checker)
 
     def get_enumerated_values(self, type_):
         raise NotImplementedError('To be implemented by subclasses.')
@@ -651,7 +916,12 @@ class Generator(object):
         raise NotImplementedError('To be implemented by subclasses.')
 
     def generate_definition_inner_process(self, type_, checker):
-        raise NotImplementedError('To be implemented by subclasses.')
+        formatter = self.get_type_formatter(self.definition_formatters, type_)
+
+        if formatter is None:
+            return [], []
+
+        return formatter(type_, checker)
 
     def generate_helpers(self, definitions):
         raise NotImplementedError('To be implemented by subclasses.')
@@ -665,13 +935,27 @@ def canonical(value):
     return re.sub(r'[^a-zA-Z0-9]', '_', value)
 
 
+SNAKE_CASE_BY_CAMEL_CASE = {}
+
+
 def camel_to_snake_case(value):
-    value = re.sub(r'(.)([A-Z][a-z]+)', r'\1_\2', value)
-    value = re.sub(r'(_+)', '_', value)
-    value = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', value).lower()
-    value = canonical(value)
+    """Convert given camel case string to snake case. Module and type
+    names are converted over and over, so the results are cached.
+
+    """
+
+    try:
+        return SNAKE_CASE_BY_CAMEL_CASE[value]
+    except KeyError:
+        pass
 
-    return value
+    snake_case = re.sub(r'(.)([A-Z][a-z]+)', r'\1_\2', value)
+    snake_case = re.sub(r'(_+)', '_', snake_case)
+    snake_case = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', snake_case).lower()
+    snake_case = canonical(snake_case)
+    SNAKE_CASE_BY_CAMEL_CASE[value] = snake_case
+
+    return snake_case
 
 
 def join_lines(lines, suffix):
@@ -704,17 +988,46 @@ def strip_blank_lines(lines):
 
 
 def indent_lines(lines):
+    """Returns given lines indented one level, with blank lines at the
+    start and end removed and consecutive blank lines merged into one,
+    all in a single pass.
+
+    """
+
     indented_lines = []
 
     for line in lines:
         if line:
-            indented_line = 4 * ' ' + line
-        else:
-            indented_line = line
+            indented_lines.append(4 * ' ' + line)
+        elif indented_lines and indented_lines[-1]:
+            indented_lines.append(line)
+
+    if indented_lines and not indented_lines[-1]:
+        del indented_lines[-1]
+
+    return indented_lines
 
-        indented_lines.append(indented_line)
 
-    return strip_blank_lines(indented_lines)
+def format_function_body(variable_lines, lines):
+    """Returns given variable declarations and statements as an indented
+    function body, with the declarations separated from the statements
+    by a blank line. All lines are written to a single writer and
+    joined once.
+
+    """
+
+    body = LinesWriter()
+
+    with body.block():
+        if variable_lines:
+            body.extend(variable_lines)
+            body.append('')
+
+        body.extend(lines)
+
+    body.append('')
+
+    return '\n'.join(body.lines)
 
 
 def dedent_lines(lines):
@@ -726,23 +1039,33 @@ def topological_sort(graph):
     of lists of dependencies. The returned keys define an order so
     that all dependent items are in front of the originating item.
 
-    """
+    Visited nodes are tracked in a set, so each node and edge is only
+    processed once. The depth first search uses an explicit stack
+    instead of recursion, so long chains of dependencies do not hit the
+    recursion limit.
 
-    def recurse(node, path):
-        if node not in path:
-            edges = graph[node]
+    """
 
-            for edge in edges:
-                if edge not in path:
-                    path = recurse(edge, path)
+    visited = set()
+    path = []
 
-            path = path + [node]
+    for root in sorted(graph):
+        if root in visited:
+            continue
 
-        return path
+        visited.add(root)
+        stack = [(root, iter(graph[root]))]
 
-    path = []
+        while stack:
+            node, edges = stack[-1]
 
-    for node in sorted(graph):
-        path = recurse(node, path)
+            for edge in edges:
+                if edge not in visited:
+                    visited.add(edge)
+                    stack.append((edge, iter(graph[edge])))
+                    break
+            else:
+                stack.pop()
+                path.append(node)
 
     return path
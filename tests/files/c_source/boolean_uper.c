@@ -32,14 +32,24 @@
 
 #include "boolean_uper.h"
 
+#if !defined(ASN1TOOLS_RESTRICT)
+#    if defined(_MSC_VER)
+#        define ASN1TOOLS_RESTRICT __restrict
+#    elif defined(__STDC_VERSION__) && (__STDC_VERSION__ >= 199901L)
+#        define ASN1TOOLS_RESTRICT restrict
+#    else
+#        define ASN1TOOLS_RESTRICT
+#    endif
+#endif
+
 struct encoder_t {
-    uint8_t *buf_p;
+    uint8_t *ASN1TOOLS_RESTRICT buf_p;
     ssize_t size;
     ssize_t pos;
 };
 
 struct decoder_t {
-    const uint8_t *buf_p;
+    const uint8_t *ASN1TOOLS_RESTRICT buf_p;
     ssize_t size;
     ssize_t pos;
 };
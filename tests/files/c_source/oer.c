@@ -32,54 +32,78 @@
 
 #include "oer.h"
 
+#if !defined(ASN1TOOLS_RESTRICT)
+#    if defined(_MSC_VER)
+#        define ASN1TOOLS_RESTRICT __restrict
+#    elif defined(__STDC_VERSION__) && (__STDC_VERSION__ >= 199901L)
+#        define ASN1TOOLS_RESTRICT restrict
+#    else
+#        define ASN1TOOLS_RESTRICT
+#    endif
+#endif
+
 struct encoder_t {
-    uint8_t *buf_p;
+    uint8_t *ASN1TOOLS_RESTRICT buf_p;
     ssize_t size;
     ssize_t pos;
 };
 
 struct decoder_t {
-    const uint8_t *buf_p;
+    const uint8_t *ASN1TOOLS_RESTRICT buf_p;
     ssize_t size;
     ssize_t pos;
 };
 
 
-static uint32_t length_determinant_length(uint32_t value)
+static uint8_t minimum_uint_length(uint32_t value)
 {
-    uint32_t length;
+#if defined(__GNUC__) || defined(__clang__)
+    return ((uint8_t)((39 - __builtin_clz(value | 1u)) / 8));
+#else
+    uint8_t length;
 
-    if (value < 128u) {
+    if (value < 256u) {
         length = 1;
-    } else if (value < 256u) {
-        length = 2;
     } else if (value < 65536u) {
-        length = 3;
+        length = 2;
     } else if (value < 16777216u) {
-        length = 4;
+        length = 3;
     } else {
-        length = 5;
+        length = 4;
     }
 
     return (length);
+#endif
 }
 
-static uint8_t minimum_uint_length(uint32_t value)
+static uint32_t length_determinant_length(uint32_t value)
 {
-    uint8_t length;
+    uint32_t length;
 
-    if (value < 256u) {
+    if (value < 128u) {
         length = 1;
-    } else if (value < 65536u) {
-        length = 2;
-    } else if (value < 16777216u) {
-        length = 3;
     } else {
-        length = 4;
+        length = (minimum_uint_length(value) + 1u);
     }
 
     return (length);
 }
+
+#if defined(__BYTE_ORDER__) && (__BYTE_ORDER__ == __ORDER_BIG_ENDIAN__)
+#    define ASN1TOOLS_BIG_ENDIAN_16(value) (value)
+#    define ASN1TOOLS_BIG_ENDIAN_32(value) (value)
+#    define ASN1TOOLS_BIG_ENDIAN_64(value) (value)
+#elif defined(__GNUC__) || defined(__clang__)
+#    define ASN1TOOLS_BIG_ENDIAN_16(value) __builtin_bswap16(value)
+#    define ASN1TOOLS_BIG_ENDIAN_32(value) __builtin_bswap32(value)
+#    define ASN1TOOLS_BIG_ENDIAN_64(value) __builtin_bswap64(value)
+#elif defined(_MSC_VER)
+#    include <stdlib.h>
+#    define ASN1TOOLS_BIG_ENDIAN_16(value) _byteswap_ushort(value)
+#    define ASN1TOOLS_BIG_ENDIAN_32(value) _byteswap_ulong(value)
+#    define ASN1TOOLS_BIG_ENDIAN_64(value) _byteswap_uint64(value)
+#endif
+
 static void encoder_init(struct encoder_t *self_p,
                          uint8_t *buf_p,
                          size_t size)
@@ -120,7 +144,7 @@ static ssize_t encoder_alloc(struct encoder_t *self_p,
 }
 
 static void encoder_append_bytes(struct encoder_t *self_p,
-                                 const uint8_t *buf_p,
+                                 const uint8_t *ASN1TOOLS_RESTRICT buf_p,
                                  size_t size)
 {
     ssize_t pos;
@@ -134,26 +158,49 @@ static void encoder_append_bytes(struct encoder_t *self_p,
     (void)memcpy(&self_p->buf_p[pos], buf_p, size);
 }
 
+static void encoder_append_fixed(struct encoder_t *self_p,
+                                 const uint8_t *ASN1TOOLS_RESTRICT buf_p,
+                                 size_t size)
+{
+    if ((self_p->pos + (ssize_t)size) <= self_p->size) {
+        (void)memcpy(&self_p->buf_p[self_p->pos], buf_p, size);
+        self_p->pos += (ssize_t)size;
+    } else {
+        encoder_abort(self_p, ENOMEM);
+    }
+}
+
 static void encoder_append_uint8(struct encoder_t *self_p,
                                  uint8_t value)
 {
-    encoder_append_bytes(self_p, &value, sizeof(value));
+    encoder_append_fixed(self_p, &value, sizeof(value));
 }
 
 static void encoder_append_uint16(struct encoder_t *self_p,
                                   uint16_t value)
 {
+#if defined(ASN1TOOLS_BIG_ENDIAN_16)
+    value = ASN1TOOLS_BIG_ENDIAN_16(value);
+
+    encoder_append_fixed(self_p, (const uint8_t *)&value, sizeof(value));
+#else
     uint8_t buf[2];
 
     buf[0] = (uint8_t)(value >> 8);
     buf[1] = (uint8_t)value;
 
-    encoder_append_bytes(self_p, &buf[0], sizeof(buf));
+    encoder_append_fixed(self_p, &buf[0], sizeof(buf));
+#endif
 }
 
 static void encoder_append_uint32(struct encoder_t *self_p,
                                   uint32_t value)
 {
+#if defined(ASN1TOOLS_BIG_ENDIAN_32)
+    value = ASN1TOOLS_BIG_ENDIAN_32(value);
+
+    encoder_append_fixed(self_p, (const uint8_t *)&value, sizeof(value));
+#else
     uint8_t buf[4];
 
     buf[0] = (uint8_t)(value >> 24);
@@ -161,12 +208,18 @@ static void encoder_append_uint32(struct encoder_t *self_p,
     buf[2] = (uint8_t)(value >> 8);
     buf[3] = (uint8_t)value;
 
-    encoder_append_bytes(self_p, &buf[0], sizeof(buf));
+    encoder_append_fixed(self_p, &buf[0], sizeof(buf));
+#endif
 }
 
 static void encoder_append_uint64(struct encoder_t *self_p,
                                   uint64_t value)
 {
+#if defined(ASN1TOOLS_BIG_ENDIAN_64)
+    value = ASN1TOOLS_BIG_ENDIAN_64(value);
+
+    encoder_append_fixed(self_p, (const uint8_t *)&value, sizeof(value));
+#else
     uint8_t buf[8];
 
     buf[0] = (uint8_t)(value >> 56);
@@ -178,7 +231,8 @@ static void encoder_append_uint64(struct encoder_t *self_p,
     buf[6] = (uint8_t)(value >> 8);
     buf[7] = (uint8_t)value;
 
-    encoder_append_bytes(self_p, &buf[0], sizeof(buf));
+    encoder_append_fixed(self_p, &buf[0], sizeof(buf));
+#endif
 }
 
 static void encoder_append_int8(struct encoder_t *self_p,
@@ -220,8 +274,13 @@ static void encoder_append_uint(struct encoder_t *self_p,
         break;
 
     case 3:
+#if defined(ASN1TOOLS_BIG_ENDIAN_32)
+        value = ASN1TOOLS_BIG_ENDIAN_32(value << 8);
+        encoder_append_fixed(self_p, (const uint8_t *)&value, 3);
+#else
         encoder_append_uint8(self_p, (uint8_t)(value >> 16));
         encoder_append_uint16(self_p, (uint16_t)value);
+#endif
         break;
 
     default:
@@ -252,26 +311,35 @@ static void encoder_append_double(struct encoder_t *self_p,
 
 static void encoder_append_bool(struct encoder_t *self_p, bool value)
 {
-    encoder_append_uint8(self_p, value ? 255u : 0u);
+    if (self_p->pos < self_p->size) {
+        self_p->buf_p[self_p->pos] = (uint8_t)(0u - (uint8_t)value);
+        self_p->pos++;
+    } else {
+        encoder_abort(self_p, ENOMEM);
+    }
 }
 
 static void encoder_append_length_determinant(struct encoder_t *self_p,
                                               uint32_t length)
 {
+    uint8_t buf[5];
+    uint8_t number_of_bytes;
+    uint8_t offset;
+
+    buf[1] = (uint8_t)(length >> 24);
+    buf[2] = (uint8_t)(length >> 16);
+    buf[3] = (uint8_t)(length >> 8);
+    buf[4] = (uint8_t)length;
+
     if (length < 128u) {
-        encoder_append_int8(self_p, (int8_t)length);
-    } else if (length < 256u) {
-        encoder_append_uint8(self_p, 0x81u);
-        encoder_append_uint8(self_p, (uint8_t)length);
-    } else if (length < 65536u) {
-        encoder_append_uint8(self_p, 0x82u);
-        encoder_append_uint16(self_p, (uint16_t)length);
-    } else if (length < 16777216u) {
-        encoder_append_uint32(self_p, length | (0x83u << 24u));
+        offset = 4;
     } else {
-        encoder_append_uint8(self_p, 0x84u);
-        encoder_append_uint32(self_p, length);
+        number_of_bytes = minimum_uint_length(length);
+        offset = (uint8_t)(4u - number_of_bytes);
+        buf[offset] = (uint8_t)(0x80u | number_of_bytes);
     }
+
+    encoder_append_bytes(self_p, &buf[offset], 5u - offset);
 }
 
 static void decoder_init(struct decoder_t *self_p,
@@ -314,7 +382,7 @@ static ssize_t decoder_free(struct decoder_t *self_p,
 }
 
 static void decoder_read_bytes(struct decoder_t *self_p,
-                               uint8_t *buf_p,
+                               uint8_t *ASN1TOOLS_RESTRICT buf_p,
                                size_t size)
 {
     ssize_t pos;
@@ -328,41 +396,77 @@ static void decoder_read_bytes(struct decoder_t *self_p,
     }
 }
 
+static void decoder_read_fixed(struct decoder_t *self_p,
+                               uint8_t *ASN1TOOLS_RESTRICT buf_p,
+                               size_t size)
+{
+    if ((self_p->pos + (ssize_t)size) <= self_p->size) {
+        (void)memcpy(buf_p, &self_p->buf_p[self_p->pos], size);
+        self_p->pos += (ssize_t)size;
+    } else {
+        (void)memset(buf_p, 0, size);
+        decoder_abort(self_p, EOUTOFDATA);
+    }
+}
+
 static uint8_t decoder_read_uint8(struct decoder_t *self_p)
 {
     uint8_t value;
 
-    decoder_read_bytes(self_p, &value, sizeof(value));
+    decoder_read_fixed(self_p, &value, sizeof(value));
 
     return (value);
 }
 
 static uint16_t decoder_read_uint16(struct decoder_t *self_p)
 {
+#if defined(ASN1TOOLS_BIG_ENDIAN_16)
+    uint16_t value;
+
+    decoder_read_fixed(self_p, (uint8_t *)&value, sizeof(value));
+
+    return (ASN1TOOLS_BIG_ENDIAN_16(value));
+#else
     uint8_t buf[2];
 
-    decoder_read_bytes(self_p, &buf[0], sizeof(buf));
+    decoder_read_fixed(self_p, &buf[0], sizeof(buf));
 
     return (uint16_t)(((uint16_t)buf[0] << 8) | (uint16_t)buf[1]);
+#endif
 }
 
 static uint32_t decoder_read_uint32(struct decoder_t *self_p)
 {
+#if defined(ASN1TOOLS_BIG_ENDIAN_32)
+    uint32_t value;
+
+    decoder_read_fixed(self_p, (uint8_t *)&value, sizeof(value));
+
+    return (ASN1TOOLS_BIG_ENDIAN_32(value));
+#else
     uint8_t buf[4];
 
-    decoder_read_bytes(self_p, &buf[0], sizeof(buf));
+    decoder_read_fixed(self_p, &buf[0], sizeof(buf));
 
     return (((uint32_t)buf[0] << 24)
             | ((uint32_t)buf[1] << 16)
             | ((uint32_t)buf[2] << 8)
             | (uint32_t)buf[3]);
+#endif
 }
 
 static uint64_t decoder_read_uint64(struct decoder_t *self_p)
 {
+#if defined(ASN1TOOLS_BIG_ENDIAN_64)
+    uint64_t value;
+
+    decoder_read_fixed(self_p, (uint8_t *)&value, sizeof(value));
+
+    return (ASN1TOOLS_BIG_ENDIAN_64(value));
+#else
     uint8_t buf[8];
 
-    decoder_read_bytes(self_p, &buf[0], sizeof(buf));
+    decoder_read_fixed(self_p, &buf[0], sizeof(buf));
 
     return (((uint64_t)buf[0] << 56)
             | ((uint64_t)buf[1] << 48)
@@ -372,6 +476,7 @@ static uint64_t decoder_read_uint64(struct decoder_t *self_p)
             | ((uint64_t)buf[5] << 16)
             | ((uint64_t)buf[6] << 8)
             | (uint64_t)buf[7]);
+#endif
 }
 
 static int8_t decoder_read_int8(struct decoder_t *self_p)
@@ -410,8 +515,14 @@ static uint32_t decoder_read_uint(struct decoder_t *self_p,
         break;
 
     case 3:
+#if defined(ASN1TOOLS_BIG_ENDIAN_32)
+        value = 0;
+        decoder_read_fixed(self_p, (uint8_t *)&value, 3);
+        value = (ASN1TOOLS_BIG_ENDIAN_32(value) >> 8);
+#else
         value = (((uint32_t)decoder_read_uint8(self_p) << 16)
                  | decoder_read_uint16(self_p));
+#endif
         break;
 
     case 4:
@@ -452,39 +563,55 @@ static double decoder_read_double(struct decoder_t *self_p)
 
 static bool decoder_read_bool(struct decoder_t *self_p)
 {
-    return (decoder_read_uint8(self_p) != 0u);
+    bool value;
+
+    if (self_p->pos < self_p->size) {
+        value = (self_p->buf_p[self_p->pos] != 0u);
+        self_p->pos++;
+    } else {
+        value = false;
+        decoder_abort(self_p, EOUTOFDATA);
+    }
+
+    return (value);
 }
 
 static uint32_t decoder_read_length_determinant(struct decoder_t *self_p)
 {
     uint32_t length;
+    uint8_t number_of_bytes;
+    ssize_t pos;
+#if !defined(ASN1TOOLS_BIG_ENDIAN_32)
+    uint8_t i;
+#endif
 
     length = decoder_read_uint8(self_p);
 
     if ((length & 0x80u) != 0u) {
-        switch (length & 0x7fu) {
-
-        case 1:
-            length = decoder_read_uint8(self_p);
-            break;
+        number_of_bytes = (uint8_t)(length & 0x7fu);
 
-        case 2:
-            length = decoder_read_uint16(self_p);
-            break;
+        if ((number_of_bytes == 0u) || (number_of_bytes > 4u)) {
+            return (0xffffffffu);
+        }
 
-        case 3:
-            length = (((uint32_t)decoder_read_uint8(self_p) << 16)
-                      | decoder_read_uint16(self_p));
-            break;
+        pos = decoder_free(self_p, number_of_bytes);
+        length = 0;
 
-        case 4:
-            length = decoder_read_uint32(self_p);
-            break;
+        if (pos < 0) {
+            return (length);
+        }
 
-        default:
-            length = 0xffffffffu;
-            break;
+#if defined(ASN1TOOLS_BIG_ENDIAN_32)
+        (void)memcpy(((uint8_t *)&length) + (4u - number_of_bytes),
+                     &self_p->buf_p[pos],
+                     number_of_bytes);
+        length = ASN1TOOLS_BIG_ENDIAN_32(length);
+#else
+        for (i = 0; i < number_of_bytes; i++) {
+            length <<= 8;
+            length |= self_p->buf_p[pos + i];
         }
+#endif
     }
 
     return (length);
@@ -505,7 +632,7 @@ static uint32_t decoder_read_tag(struct decoder_t *self_p)
 
     return (tag);
 }
-static uint32_t get_choice_j_length(const struct oer_c_source_ag_t *src_p) {
+static uint32_t get_choice_oer_c_source_ag_j_length(const struct oer_c_source_ag_t *src_p) {
     uint32_t length;
 
     switch (src_p->j.choice) {
@@ -538,7 +665,7 @@ static void oer_c_source_a_encode_inner(
     encoder_append_uint32(encoder_p, src_p->g);
     encoder_append_uint64(encoder_p, src_p->h);
     encoder_append_bool(encoder_p, src_p->i);
-    encoder_append_bytes(encoder_p,
+    encoder_append_fixed(encoder_p,
                          &src_p->j.buf[0],
                          11);
 }
@@ -556,7 +683,7 @@ static void oer_c_source_a_decode_inner(
     dst_p->g = decoder_read_uint32(decoder_p);
     dst_p->h = decoder_read_uint64(decoder_p);
     dst_p->i = decoder_read_bool(decoder_p);
-    decoder_read_bytes(decoder_p,
+    decoder_read_fixed(decoder_p,
                        &dst_p->j.buf[0],
                        11);
 }
@@ -3230,23 +3357,10 @@ static void oer_c_source_d_encode_inner(
         encoder_append_bytes(encoder_p,
                              &src_p->elements[i].g.l.buf[0],
                              src_p->elements[i].g.l.length);
-        present_mask[0] = 0;
-
-        if (src_p->elements[i].m.is_n_present) {
-            present_mask[0] |= 0x80u;
-        }
-
-        if (src_p->elements[i].m.o != 3) {
-            present_mask[0] |= 0x40u;
-        }
-
-        if (src_p->elements[i].m.is_p_present) {
-            present_mask[0] |= 0x20u;
-        }
-
-        if (src_p->elements[i].m.s != false) {
-            present_mask[0] |= 0x10u;
-        }
+        present_mask[0] = (uint8_t)((src_p->elements[i].m.is_n_present << 7)
+                                    | ((src_p->elements[i].m.o != 3) << 6)
+                                    | (src_p->elements[i].m.is_p_present << 5)
+                                    | ((src_p->elements[i].m.s != false) << 4));
 
         encoder_append_bytes(encoder_p,
                              &present_mask[0],
@@ -3261,17 +3375,13 @@ static void oer_c_source_d_encode_inner(
         }
 
         if (src_p->elements[i].m.is_p_present) {
-            present_mask_2[0] = 0;
-
-            if (src_p->elements[i].m.p.is_r_present) {
-                present_mask_2[0] |= 0x80u;
-            }
+            present_mask_2[0] = (uint8_t)(src_p->elements[i].m.p.is_r_present << 7);
 
             encoder_append_bytes(encoder_p,
                                  &present_mask_2[0],
                                  sizeof(present_mask_2));
 
-            encoder_append_bytes(encoder_p,
+            encoder_append_fixed(encoder_p,
                                  &src_p->elements[i].m.p.q.buf[0],
                                  5);
 
@@ -3374,8 +3484,8 @@ static void oer_c_source_d_decode_inner(
                            &present_mask[0],
                            sizeof(present_mask));
 
-        dst_p->elements[i].m.is_n_present = ((present_mask[0] & 0x80u) == 0x80u);
-        dst_p->elements[i].m.is_p_present = ((present_mask[0] & 0x20u) == 0x20u);
+        dst_p->elements[i].m.is_n_present = ((present_mask[0] >> 7) & 1u);
+        dst_p->elements[i].m.is_p_present = ((present_mask[0] >> 5) & 1u);
 
         if (dst_p->elements[i].m.is_n_present) {
             dst_p->elements[i].m.n = decoder_read_bool(decoder_p);
@@ -3392,9 +3502,9 @@ static void oer_c_source_d_decode_inner(
                                &present_mask_2[0],
                                sizeof(present_mask_2));
 
-            dst_p->elements[i].m.p.is_r_present = ((present_mask_2[0] & 0x80u) == 0x80u);
+            dst_p->elements[i].m.p.is_r_present = ((present_mask_2[0] >> 7) & 1u);
 
-            decoder_read_bytes(decoder_p,
+            decoder_read_fixed(decoder_p,
                                &dst_p->elements[i].m.p.q.buf[0],
                                5);
 
@@ -3470,15 +3580,8 @@ static void oer_c_source_ae_encode_inner(
 {
     uint8_t present_mask[1];
 
-    present_mask[0] = 0;
-
-    if (src_p->is_a_present) {
-        present_mask[0] |= 0x40u;
-    }
-
-    if (src_p->b != true) {
-        present_mask[0] |= 0x20u;
-    }
+    present_mask[0] = (uint8_t)((src_p->is_a_present << 6)
+                                | ((src_p->b != true) << 5));
 
     encoder_append_bytes(encoder_p,
                          &present_mask[0],
@@ -3505,7 +3608,7 @@ static void oer_c_source_ae_decode_inner(
                        &present_mask[0],
                        sizeof(present_mask));
 
-    dst_p->is_a_present = ((present_mask[0] & 0x40u) == 0x40u);
+    dst_p->is_a_present = ((present_mask[0] >> 6) & 1u);
 
     if (dst_p->is_a_present) {
         dst_p->a = decoder_read_bool(decoder_p);
@@ -3528,12 +3631,7 @@ static void oer_c_source_ah_encode_inner(
     uint8_t addition_mask[1];
     uint8_t enum_length;
 
-    if(src_p->is_d_addition_present || src_p->is_e_addition_present) {
-        present_mask[0] = 0x80;
-    }
-    else {
-        present_mask[0] = 0x0;
-    }
+    present_mask[0] = (uint8_t)((src_p->is_d_addition_present || src_p->is_e_addition_present) << 7);
 
     encoder_append_bytes(encoder_p,
                          &present_mask[0],
@@ -3544,15 +3642,9 @@ static void oer_c_source_ah_encode_inner(
     if((present_mask[0] & 0x80u) == 0x80u) {
         encoder_append_length_determinant(encoder_p, 2);
         encoder_append_uint8(encoder_p, 6);
-        addition_mask[0] = 0;
-
-        if (src_p->is_d_addition_present) {
-            addition_mask[0] |= 0x80u;
-        }
+        addition_mask[0] = (uint8_t)((src_p->is_d_addition_present << 7)
+                                     | (src_p->is_e_addition_present << 6));
 
-        if (src_p->is_e_addition_present) {
-            addition_mask[0] |= 0x40u;
-        }
         encoder_append_bytes(encoder_p,
                              &addition_mask[0],
                              sizeof(addition_mask));
@@ -3688,14 +3780,11 @@ static void oer_c_source_af_encode_inner(
     uint8_t present_mask[1];
     uint8_t addition_mask[2];
 
-    if(src_p->is_b_addition_present || src_p->is_e_addition_present || src_p->is_f_addition_present ||
-       src_p->is_g_addition_present || src_p->is_h_addition_present || src_p->is_i_addition_present ||
-       src_p->is_j_addition_present || src_p->is_k_addition_present || src_p->is_l_addition_present) {
-        present_mask[0] = 0x80;
-    }
-    else {
-        present_mask[0] = 0x0;
-    }
+    present_mask[0] = (uint8_t)((src_p->is_b_addition_present || src_p->is_e_addition_present ||
+                                 src_p->is_f_addition_present || src_p->is_g_addition_present ||
+                                 src_p->is_h_addition_present || src_p->is_i_addition_present ||
+                                 src_p->is_j_addition_present || src_p->is_k_addition_present ||
+                                 src_p->is_l_addition_present) << 7);
 
     encoder_append_bytes(encoder_p,
                          &present_mask[0],
@@ -3706,44 +3795,16 @@ static void oer_c_source_af_encode_inner(
     if((present_mask[0] & 0x80u) == 0x80u) {
         encoder_append_length_determinant(encoder_p, 3);
         encoder_append_uint8(encoder_p, 7);
-        addition_mask[0] = 0;
-        addition_mask[1] = 0;
-
-        if (src_p->is_b_addition_present) {
-            addition_mask[0] |= 0x80u;
-        }
-
-        if (src_p->is_e_addition_present) {
-            addition_mask[0] |= 0x40u;
-        }
-
-        if (src_p->is_f_addition_present) {
-            addition_mask[0] |= 0x20u;
-        }
-
-        if (src_p->is_g_addition_present) {
-            addition_mask[0] |= 0x10u;
-        }
+        addition_mask[0] = (uint8_t)((src_p->is_b_addition_present << 7)
+                                     | (src_p->is_e_addition_present << 6)
+                                     | (src_p->is_f_addition_present << 5)
+                                     | (src_p->is_g_addition_present << 4)
+                                     | (src_p->is_h_addition_present << 3)
+                                     | (src_p->is_i_addition_present << 2)
+                                     | (src_p->is_j_addition_present << 1)
+                                     | (src_p->is_k_addition_present));
+        addition_mask[1] = (uint8_t)(src_p->is_l_addition_present << 7);
 
-        if (src_p->is_h_addition_present) {
-            addition_mask[0] |= 0x08u;
-        }
-
-        if (src_p->is_i_addition_present) {
-            addition_mask[0] |= 0x04u;
-        }
-
-        if (src_p->is_j_addition_present) {
-            addition_mask[0] |= 0x02u;
-        }
-
-        if (src_p->is_k_addition_present) {
-            addition_mask[0] |= 0x01u;
-        }
-
-        if (src_p->is_l_addition_present) {
-            addition_mask[1] |= 0x80u;
-        }
         encoder_append_bytes(encoder_p,
                              &addition_mask[0],
                              sizeof(addition_mask));
@@ -3954,14 +4015,10 @@ static void oer_c_source_ag_encode_inner(
     uint8_t i_2;
     uint8_t enum_length;
 
-    if(src_p->is_b_addition_present || src_p->is_c_addition_present || src_p->is_d_addition_present ||
-       src_p->is_h_addition_present || src_p->is_i_addition_present || src_p->is_j_addition_present ||
-       src_p->is_m_addition_present) {
-        present_mask[0] = 0x80;
-    }
-    else {
-        present_mask[0] = 0x0;
-    }
+    present_mask[0] = (uint8_t)((src_p->is_b_addition_present || src_p->is_c_addition_present ||
+                                 src_p->is_d_addition_present || src_p->is_h_addition_present ||
+                                 src_p->is_i_addition_present || src_p->is_j_addition_present ||
+                                 src_p->is_m_addition_present) << 7);
 
     encoder_append_bytes(encoder_p,
                          &present_mask[0],
@@ -3972,35 +4029,14 @@ static void oer_c_source_ag_encode_inner(
     if((present_mask[0] & 0x80u) == 0x80u) {
         encoder_append_length_determinant(encoder_p, 2);
         encoder_append_uint8(encoder_p, 1);
-        addition_mask[0] = 0;
-
-        if (src_p->is_b_addition_present) {
-            addition_mask[0] |= 0x80u;
-        }
-
-        if (src_p->is_c_addition_present) {
-            addition_mask[0] |= 0x40u;
-        }
-
-        if (src_p->is_d_addition_present) {
-            addition_mask[0] |= 0x20u;
-        }
-
-        if (src_p->is_h_addition_present) {
-            addition_mask[0] |= 0x10u;
-        }
-
-        if (src_p->is_i_addition_present) {
-            addition_mask[0] |= 0x08u;
-        }
+        addition_mask[0] = (uint8_t)((src_p->is_b_addition_present << 7)
+                                     | (src_p->is_c_addition_present << 6)
+                                     | (src_p->is_d_addition_present << 5)
+                                     | (src_p->is_h_addition_present << 4)
+                                     | (src_p->is_i_addition_present << 3)
+                                     | (src_p->is_j_addition_present << 2)
+                                     | (src_p->is_m_addition_present << 1));
 
-        if (src_p->is_j_addition_present) {
-            addition_mask[0] |= 0x04u;
-        }
-
-        if (src_p->is_m_addition_present) {
-            addition_mask[0] |= 0x02u;
-        }
         encoder_append_bytes(encoder_p,
                              &addition_mask[0],
                              sizeof(addition_mask));
@@ -4048,7 +4084,7 @@ static void oer_c_source_ag_encode_inner(
         }
 
         if (src_p->is_j_addition_present) {
-            encoder_append_length_determinant(encoder_p, get_choice_j_length(src_p));
+            encoder_append_length_determinant(encoder_p, get_choice_oer_c_source_ag_j_length(src_p));
 
             switch (src_p->j.choice) {
 
@@ -4070,7 +4106,7 @@ static void oer_c_source_ag_encode_inner(
 
         if (src_p->is_m_addition_present) {
             encoder_append_length_determinant(encoder_p, 5u);
-            encoder_append_bytes(encoder_p,
+            encoder_append_fixed(encoder_p,
                                  &src_p->m.buf[0],
                                  5);
         }
@@ -4243,7 +4279,7 @@ static void oer_c_source_ag_decode_inner(
 
         if (dst_p->is_m_addition_present) {
             (void)decoder_read_length_determinant(decoder_p);
-            decoder_read_bytes(decoder_p,
+            decoder_read_fixed(decoder_p,
                                &dst_p->m.buf[0],
                                5);
         }
@@ -4357,6 +4393,70 @@ static void oer_c_source_ai_decode_inner(
     oer_c_source_ak_decode_inner(decoder_p, &dst_p->a);
 }
 
+static void oer_c_source_al_encode_inner(
+    struct encoder_t *encoder_p,
+    const struct oer_c_source_al_t *src_p)
+{
+    uint8_t number_of_length_bytes;
+    uint8_t number_of_length_bytes_2;
+
+    number_of_length_bytes = minimum_uint_length(4);
+    encoder_append_uint8(encoder_p, number_of_length_bytes);
+    encoder_append_uint(encoder_p,
+                        4,
+                        number_of_length_bytes);
+
+    encoder_append_fixed(encoder_p,
+                         &src_p->a.elements[0],
+                         4);
+
+    number_of_length_bytes_2 = minimum_uint_length(40);
+    encoder_append_uint8(encoder_p, number_of_length_bytes_2);
+    encoder_append_uint(encoder_p,
+                        40,
+                        number_of_length_bytes_2);
+
+    encoder_append_bytes(encoder_p,
+                         (const uint8_t *)&src_p->b.elements[0],
+                         40);
+}
+
+static void oer_c_source_al_decode_inner(
+    struct decoder_t *decoder_p,
+    struct oer_c_source_al_t *dst_p)
+{
+    uint8_t number_of_length_bytes;
+    uint8_t length;
+    uint8_t number_of_length_bytes_2;
+    uint8_t length_2;
+
+    number_of_length_bytes = decoder_read_uint8(decoder_p);
+    length = decoder_read_uint8(decoder_p);
+
+    if ((number_of_length_bytes != 1u) || (length > 4u)) {
+        decoder_abort(decoder_p, EBADLENGTH);
+
+        return;
+    }
+
+    decoder_read_fixed(decoder_p,
+                       &dst_p->a.elements[0],
+                       4);
+
+    number_of_length_bytes_2 = decoder_read_uint8(decoder_p);
+    length_2 = decoder_read_uint8(decoder_p);
+
+    if ((number_of_length_bytes_2 != 1u) || (length_2 > 40u)) {
+        decoder_abort(decoder_p, EBADLENGTH);
+
+        return;
+    }
+
+    decoder_read_bytes(decoder_p,
+                       (uint8_t *)&dst_p->b.elements[0],
+                       40);
+}
+
 static void oer_c_source_b_encode_inner(
     struct encoder_t *encoder_p,
     const struct oer_c_source_b_t *src_p)
@@ -4631,44 +4731,15 @@ static void oer_c_source_g_encode_inner(
 {
     uint8_t present_mask[2];
 
-    present_mask[0] = 0;
-    present_mask[1] = 0;
-
-    if (src_p->is_a_present) {
-        present_mask[0] |= 0x80u;
-    }
-
-    if (src_p->is_b_present) {
-        present_mask[0] |= 0x40u;
-    }
-
-    if (src_p->is_c_present) {
-        present_mask[0] |= 0x20u;
-    }
-
-    if (src_p->is_d_present) {
-        present_mask[0] |= 0x10u;
-    }
-
-    if (src_p->is_e_present) {
-        present_mask[0] |= 0x08u;
-    }
-
-    if (src_p->is_f_present) {
-        present_mask[0] |= 0x04u;
-    }
-
-    if (src_p->is_g_present) {
-        present_mask[0] |= 0x02u;
-    }
-
-    if (src_p->is_h_present) {
-        present_mask[0] |= 0x01u;
-    }
-
-    if (src_p->is_i_present) {
-        present_mask[1] |= 0x80u;
-    }
+    present_mask[0] = (uint8_t)((src_p->is_a_present << 7)
+                                | (src_p->is_b_present << 6)
+                                | (src_p->is_c_present << 5)
+                                | (src_p->is_d_present << 4)
+                                | (src_p->is_e_present << 3)
+                                | (src_p->is_f_present << 2)
+                                | (src_p->is_g_present << 1)
+                                | (src_p->is_h_present));
+    present_mask[1] = (uint8_t)(src_p->is_i_present << 7);
 
     encoder_append_bytes(encoder_p,
                          &present_mask[0],
@@ -4721,15 +4792,15 @@ static void oer_c_source_g_decode_inner(
                        &present_mask[0],
                        sizeof(present_mask));
 
-    dst_p->is_a_present = ((present_mask[0] & 0x80u) == 0x80u);
-    dst_p->is_b_present = ((present_mask[0] & 0x40u) == 0x40u);
-    dst_p->is_c_present = ((present_mask[0] & 0x20u) == 0x20u);
-    dst_p->is_d_present = ((present_mask[0] & 0x10u) == 0x10u);
-    dst_p->is_e_present = ((present_mask[0] & 0x08u) == 0x08u);
-    dst_p->is_f_present = ((present_mask[0] & 0x04u) == 0x04u);
-    dst_p->is_g_present = ((present_mask[0] & 0x02u) == 0x02u);
-    dst_p->is_h_present = ((present_mask[0] & 0x01u) == 0x01u);
-    dst_p->is_i_present = ((present_mask[1] & 0x80u) == 0x80u);
+    dst_p->is_a_present = ((present_mask[0] >> 7) & 1u);
+    dst_p->is_b_present = ((present_mask[0] >> 6) & 1u);
+    dst_p->is_c_present = ((present_mask[0] >> 5) & 1u);
+    dst_p->is_d_present = ((present_mask[0] >> 4) & 1u);
+    dst_p->is_e_present = ((present_mask[0] >> 3) & 1u);
+    dst_p->is_f_present = ((present_mask[0] >> 2) & 1u);
+    dst_p->is_g_present = ((present_mask[0] >> 1) & 1u);
+    dst_p->is_h_present = (present_mask[0] & 1u);
+    dst_p->is_i_present = ((present_mask[1] >> 7) & 1u);
 
     if (dst_p->is_a_present) {
         dst_p->a = decoder_read_bool(decoder_p);
@@ -4788,7 +4859,7 @@ static void oer_c_source_i_encode_inner(
     struct encoder_t *encoder_p,
     const struct oer_c_source_i_t *src_p)
 {
-    encoder_append_bytes(encoder_p,
+    encoder_append_fixed(encoder_p,
                          &src_p->buf[0],
                          24);
 }
@@ -4797,7 +4868,7 @@ static void oer_c_source_i_decode_inner(
     struct decoder_t *decoder_p,
     struct oer_c_source_i_t *dst_p)
 {
-    decoder_read_bytes(decoder_p,
+    decoder_read_fixed(decoder_p,
                        &dst_p->buf[0],
                        24);
 }
@@ -5562,6 +5633,32 @@ ssize_t oer_c_source_ai_decode(
     return (decoder_get_result(&decoder));
 }
 
+ssize_t oer_c_source_al_encode(
+    uint8_t *dst_p,
+    size_t size,
+    const struct oer_c_source_al_t *src_p)
+{
+    struct encoder_t encoder;
+
+    encoder_init(&encoder, dst_p, size);
+    oer_c_source_al_encode_inner(&encoder, src_p);
+
+    return (encoder_get_result(&encoder));
+}
+
+ssize_t oer_c_source_al_decode(
+    struct oer_c_source_al_t *dst_p,
+    const uint8_t *src_p,
+    size_t size)
+{
+    struct decoder_t decoder;
+
+    decoder_init(&decoder, src_p, size);
+    oer_c_source_al_decode_inner(&decoder, dst_p);
+
+    return (decoder_get_result(&decoder));
+}
+
 ssize_t oer_c_source_b_encode(
     uint8_t *dst_p,
     size_t size,
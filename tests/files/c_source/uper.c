@@ -32,14 +32,24 @@
 
 #include "uper.h"
 
+#if !defined(ASN1TOOLS_RESTRICT)
+#    if defined(_MSC_VER)
+#        define ASN1TOOLS_RESTRICT __restrict
+#    elif defined(__STDC_VERSION__) && (__STDC_VERSION__ >= 199901L)
+#        define ASN1TOOLS_RESTRICT restrict
+#    else
+#        define ASN1TOOLS_RESTRICT
+#    endif
+#endif
+
 struct encoder_t {
-    uint8_t *buf_p;
+    uint8_t *ASN1TOOLS_RESTRICT buf_p;
     ssize_t size;
     ssize_t pos;
 };
 
 struct decoder_t {
-    const uint8_t *buf_p;
+    const uint8_t *ASN1TOOLS_RESTRICT buf_p;
     ssize_t size;
     ssize_t pos;
 };
@@ -3526,6 +3536,38 @@ static void uper_c_source_ai_decode_inner(
     uper_c_source_ak_decode_inner(decoder_p, &dst_p->a);
 }
 
+static void uper_c_source_al_encode_inner(
+    struct encoder_t *encoder_p,
+    const struct uper_c_source_al_t *src_p)
+{
+    uint8_t i;
+    uint8_t i_2;
+
+    for (i = 0; i < 4; i++) {
+        encoder_append_uint8(encoder_p, src_p->a.elements[i]);
+    }
+
+    for (i_2 = 0; i_2 < 40; i_2++) {
+        encoder_append_int8(encoder_p, src_p->b.elements[i_2]);
+    }
+}
+
+static void uper_c_source_al_decode_inner(
+    struct decoder_t *decoder_p,
+    struct uper_c_source_al_t *dst_p)
+{
+    uint8_t i;
+    uint8_t i_2;
+
+    for (i = 0; i < 4; i++) {
+        dst_p->a.elements[i] = decoder_read_uint8(decoder_p);
+    }
+
+    for (i_2 = 0; i_2 < 40; i_2++) {
+        dst_p->b.elements[i_2] = decoder_read_int8(decoder_p);
+    }
+}
+
 static void uper_c_source_b_encode_inner(
     struct encoder_t *encoder_p,
     const struct uper_c_source_b_t *src_p)
@@ -4533,6 +4575,32 @@ ssize_t uper_c_source_ai_decode(
     return (decoder_get_result(&decoder));
 }
 
+ssize_t uper_c_source_al_encode(
+    uint8_t *dst_p,
+    size_t size,
+    const struct uper_c_source_al_t *src_p)
+{
+    struct encoder_t encoder;
+
+    encoder_init(&encoder, dst_p, size);
+    uper_c_source_al_encode_inner(&encoder, src_p);
+
+    return (encoder_get_result(&encoder));
+}
+
+ssize_t uper_c_source_al_decode(
+    struct uper_c_source_al_t *dst_p,
+    const uint8_t *src_p,
+    size_t size)
+{
+    struct decoder_t decoder;
+
+    decoder_init(&decoder, src_p, size);
+    uper_c_source_al_decode_inner(&decoder, dst_p);
+
+    return (decoder_get_result(&decoder));
+}
+
 ssize_t uper_c_source_b_encode(
     uint8_t *dst_p,
     size_t size,
@@ -813,6 +813,18 @@ struct uper_c_source_ai_t {
     struct uper_c_source_ak_t a;
 };
 
+/**
+ * Type AL in module CSource.
+ */
+struct uper_c_source_al_t {
+    struct {
+        uint8_t elements[4];
+    } a;
+    struct {
+        int8_t elements[40];
+    } b;
+};
+
 /**
  * Type B in module CSource.
  */
@@ -1399,6 +1411,34 @@ ssize_t uper_c_source_ai_decode(
     const uint8_t *src_p,
     size_t size);
 
+/**
+ * Encode type AL defined in module CSource.
+ *
+ * @param[out] dst_p Buffer to encode into.
+ * @param[in] size Size of dst_p.
+ * @param[in] src_p Data to encode.
+ *
+ * @return Encoded data length or negative error code.
+ */
+ssize_t uper_c_source_al_encode(
+    uint8_t *dst_p,
+    size_t size,
+    const struct uper_c_source_al_t *src_p);
+
+/**
+ * Decode type AL defined in module CSource.
+ *
+ * @param[out] dst_p Decoded data.
+ * @param[in] src_p Data to decode.
+ * @param[in] size Size of src_p.
+ *
+ * @return Number of bytes decoded or negative error code.
+ */
+ssize_t uper_c_source_al_decode(
+    struct uper_c_source_al_t *dst_p,
+    const uint8_t *src_p,
+    size_t size);
+
 /**
  * Encode type B defined in module CSource.
  *
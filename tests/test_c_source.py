@@ -1,5 +1,10 @@
 import unittest
 
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
 import asn1tools
 
 
@@ -212,6 +217,151 @@ class Asn1ToolsCSourceTest(unittest.TestCase):
             self.assertEqual(str(cm.exception),
                              "Foo.A.a.b: INTEGER has no minimum value.")
 
+    def test_same_shape_type_declarations(self):
+        for codec, module in CODECS_AND_MODULES:
+            foo = asn1tools.compile_string(
+                'Foo DEFINITIONS AUTOMATIC TAGS ::= BEGIN '
+                '    A ::= SEQUENCE { '
+                '        a INTEGER (0..9), '
+                '        b C '
+                '    } '
+                '    B ::= A '
+                '    C ::= SEQUENCE { '
+                '        c BOOLEAN '
+                '    } '
+                '    D ::= SEQUENCE { '
+                '        a INTEGER (0..9), '
+                '        b E '
+                '    } '
+                '    E ::= SEQUENCE { '
+                '        c BOOLEAN '
+                '    } '
+                '    F ::= SEQUENCE { '
+                '        f SEQUENCE (SIZE (2)) OF SEQUENCE { '
+                '            g C '
+                '        } '
+                '    } '
+                '    G ::= SEQUENCE { '
+                '        g SEQUENCE (SIZE (2)) OF SEQUENCE { '
+                '            g C '
+                '        }, '
+                '        h BOOLEAN '
+                '    } '
+                'END',
+                codec)
+
+            generated = module.generate(foo, 'foo')
+
+            # B reuses the members of A, and E the members of C. D has
+            # the shape of A, but references another user type. The
+            # members of F and G are shared as well. The output must be
+            # the same as without reuse.
+            with patch.object(module._Generator,
+                              'get_declaration_key',
+                              return_value=None):
+                self.assertEqual(module.generate(foo, 'foo'), generated)
+
+            type_declarations = generated[0]
+
+            self.assertEqual(
+                type_declarations,
+                '/**\n'
+                ' * Type C in module Foo.\n'
+                ' */\n'
+                'struct foo_foo_c_t {\n'
+                '    bool c;\n'
+                '};\n'
+                '\n'
+                '/**\n'
+                ' * Type A in module Foo.\n'
+                ' */\n'
+                'struct foo_foo_a_t {\n'
+                '    uint8_t a;\n'
+                '    struct foo_foo_c_t b;\n'
+                '};\n'
+                '\n'
+                '/**\n'
+                ' * Type B in module Foo.\n'
+                ' */\n'
+                'struct foo_foo_b_t {\n'
+                '    uint8_t a;\n'
+                '    struct foo_foo_c_t b;\n'
+                '};\n'
+                '\n'
+                '/**\n'
+                ' * Type E in module Foo.\n'
+                ' */\n'
+                'struct foo_foo_e_t {\n'
+                '    bool c;\n'
+                '};\n'
+                '\n'
+                '/**\n'
+                ' * Type D in module Foo.\n'
+                ' */\n'
+                'struct foo_foo_d_t {\n'
+                '    uint8_t a;\n'
+                '    struct foo_foo_e_t b;\n'
+                '};\n'
+                '\n'
+                '/**\n'
+                ' * Type F in module Foo.\n'
+                ' */\n'
+                'struct foo_foo_f_t {\n'
+                '    struct {\n'
+                '        struct {\n'
+                '            struct foo_foo_c_t g;\n'
+                '        } elements[2];\n'
+                '    } f;\n'
+                '};\n'
+                '\n'
+                '/**\n'
+                ' * Type G in module Foo.\n'
+                ' */\n'
+                'struct foo_foo_g_t {\n'
+                '    struct {\n'
+                '        struct {\n'
+                '            struct foo_foo_c_t g;\n'
+                '        } elements[2];\n'
+                '    } g;\n'
+                '    bool h;\n'
+                '};\n')
+
+    def test_oer_choice_length_helpers_of_same_name(self):
+        foo = asn1tools.compile_string(
+            'Foo DEFINITIONS AUTOMATIC TAGS ::= BEGIN '
+            '    B ::= SEQUENCE { '
+            '        a BOOLEAN, '
+            '        ..., '
+            '        j CHOICE { '
+            '            c INTEGER (0..300) '
+            '        } '
+            '    } '
+            '    A ::= SEQUENCE { '
+            '        a BOOLEAN, '
+            '        ..., '
+            '        j CHOICE { '
+            '            b BOOLEAN '
+            '        } '
+            '    } '
+            'END',
+            'oer')
+
+        helpers = asn1tools.source.c.oer.generate(foo, 'foo')[2]
+        helpers = [
+            line
+            for line in helpers.splitlines()
+            if line.startswith('static uint32_t get_choice_')
+        ]
+
+        self.assertEqual(
+            helpers,
+            [
+                'static uint32_t get_choice_foo_foo_a_j_length('
+                'const struct foo_foo_a_t *src_p) {',
+                'static uint32_t get_choice_foo_foo_b_j_length('
+                'const struct foo_foo_b_t *src_p) {'
+            ])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1201,6 +1201,55 @@ TEST(oer_c_source_ag_erroneous_data)
                                      sizeof(encoded3)), -EOUTOFDATA);
 }
 
+TEST(oer_c_source_al)
+{
+    uint8_t encoded[48];
+    struct oer_c_source_al_t decoded;
+    int i;
+
+    /* Encode. */
+    decoded.a.elements[0] = 1;
+    decoded.a.elements[1] = 2;
+    decoded.a.elements[2] = 254;
+    decoded.a.elements[3] = 255;
+
+    for (i = 0; i < 40; i++) {
+        decoded.b.elements[i] = (int8_t)(i - 20);
+    }
+
+    memset(&encoded[0], 0, sizeof(encoded));
+    ASSERT_EQ(oer_c_source_al_encode(&encoded[0],
+                                     sizeof(encoded),
+                                     &decoded), sizeof(encoded));
+
+    ASSERT_MEMORY_EQ(&encoded[0],
+                     "\x01\x04\x01\x02\xfe\xff\x01\x28\xec\xed\xee\xef\xf0\xf1"
+                     "\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xfb\xfc\xfd\xfe\xff"
+                     "\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d"
+                     "\x0e\x0f\x10\x11\x12\x13",
+                     sizeof(encoded));
+
+    /* Decode. */
+    memset(&decoded, 0, sizeof(decoded));
+    ASSERT_EQ(oer_c_source_al_decode(&decoded,
+                                     &encoded[0],
+                                     sizeof(encoded)), sizeof(encoded));
+
+    ASSERT_EQ(decoded.a.elements[0], 1);
+    ASSERT_EQ(decoded.a.elements[1], 2);
+    ASSERT_EQ(decoded.a.elements[2], 254);
+    ASSERT_EQ(decoded.a.elements[3], 255);
+
+    for (i = 0; i < 40; i++) {
+        ASSERT_EQ(decoded.b.elements[i], i - 20);
+    }
+
+    /* Decode out of data. */
+    ASSERT_EQ(oer_c_source_al_decode(&decoded,
+                                     &encoded[0],
+                                     sizeof(encoded) - 1), -EOUTOFDATA);
+}
+
 TEST(oer_programming_types_float)
 {
     uint8_t encoded[4];